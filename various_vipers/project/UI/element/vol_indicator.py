@@ -1,7 +1,10 @@
 from pygame import Surface
-from pygame.font import Font
 
 from project.constants import Color, SliderProperties
+from project.utils.text_cache import TextCache
+
+
+text_cache = TextCache()
 
 
 class VolumeIndicator:
@@ -11,7 +14,6 @@ class VolumeIndicator:
         self.screen = screen
         self.number = number
 
-        self.font = Font(None, 100)
         self.volume = int()
 
     def draw(self) -> None:
@@ -20,7 +22,8 @@ class VolumeIndicator:
         if self.number == 2:
             top = SliderProperties.body_y + 100
 
-        indicator = self.font.render(str(int(self.volume)), True, Color.orange)
-        self.screen.blit(
-            indicator, (SliderProperties.body_x + SliderProperties.body_width + 20, top)
+        text_cache.atlas(100, Color.orange).draw(
+            self.screen,
+            str(int(self.volume)),
+            (SliderProperties.body_x + SliderProperties.body_width + 20, top),
         )
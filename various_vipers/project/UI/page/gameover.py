@@ -22,11 +22,17 @@ from project.constants import (
 )
 from project.gameplay.game_state import GameState
 from project.gameplay.period import Period
-from project.utils.helpers import draw_infinity_bg, realtime_to_ingame_delta_formatted
+from project.utils.helpers import (
+    draw_infinity_bg,
+    load_img,
+    realtime_to_ingame_delta_formatted,
+)
+from project.utils.text_cache import TextCache
 
 
 logger = logging.getLogger(__name__)
 game_vars = GameState()
+text_cache = TextCache()
 
 
 class GameOver:
@@ -34,15 +40,13 @@ class GameOver:
 
     def __init__(self, screen: pg.Surface):
         self.screen = screen
-        home_btn_img = pg.image.load(str(BTN["main-menu-btn"])).convert_alpha()
-        home_btn_img_h = pg.image.load(str(BTN["main-menu-btn-hover"])).convert_alpha()
+        home_btn_img = load_img(BTN["main-menu-btn"])
+        home_btn_img_h = load_img(BTN["main-menu-btn-hover"])
 
-        self.background = pg.image.load(str(PATH_GAMEOVER_BG)).convert_alpha()
+        self.background = load_img(PATH_GAMEOVER_BG)
 
-        self.star = pg.image.load(str(STAR)).convert_alpha()
-        self.star = pg.transform.scale(self.star, (40, 40))
-        self.gold_coin = pg.image.load(str(GOLD_COIN)).convert_alpha()
-        self.gold_coin = pg.transform.scale(self.gold_coin, (40, 40))
+        self.star = load_img(STAR, size=(40, 40))
+        self.gold_coin = load_img(GOLD_COIN, size=(40, 40))
 
         self.bg_rect_1 = pg.Rect(0, 0, WIDTH, HEIGHT)
         self.bg_rect_2 = pg.Rect(-WIDTH, 0, WIDTH, HEIGHT)
@@ -80,9 +84,6 @@ class GameOver:
 
         Text to draw - title, subtitle, current score, best score.
         """
-        font = pg.font.Font(None, 100)
-        font2 = pg.font.Font(None, 50)
-        font3 = pg.font.Font(None, 60)
         color = Color.black
 
         text_title = "GAME OVER !"
@@ -100,10 +101,10 @@ class GameOver:
         # 1st surface is additional surface before text (optional)
         # 2nd surface is text
         lines = [
-            (0, None, font.render(text_title, True, color)),
-            (100, None, font2.render(text_subtitle, True, color)),
-            (40, current_image, font3.render(text_current_elapsed, True, color)),
-            (50, best_image, font3.render(text_best_elapsed, True, color)),
+            (0, None, text_cache.render(text_title, 100, color)),
+            (100, None, text_cache.render(text_subtitle, 50, color)),
+            (40, current_image, text_cache.render(text_current_elapsed, 60, color)),
+            (50, best_image, text_cache.render(text_best_elapsed, 60, color)),
         ]
 
         current_offset = 0
@@ -8,7 +8,6 @@ import time
 import webbrowser
 
 import pygame as pg
-from pygame.font import Font
 
 from project.UI.element.button import Button, generate_main_buttons
 from project.UI.fx.sound import Sound
@@ -23,8 +22,10 @@ from project.constants import (
 )
 from project.utils.helpers import load_img
 from project.utils.helpers import realtime_to_ingame_delta_formatted
+from project.utils.text_cache import TextCache
 from project.utils.user_data import UserData
 
+text_cache = TextCache()
 user_data = UserData()
 user_data.load()
 
@@ -49,7 +50,6 @@ class MainMenu:
 
         # use last click timer for preventing too much clicking on the button
         self.last_click = int()
-        self.font = Font(None, 40)
 
     def __load_images(self) -> None:
         """Loads all main menu button images and their hover states."""
@@ -165,6 +165,6 @@ class MainMenu:
     def __draw_highscores(self) -> None:
         """Draws highscores in the bottom left."""
         date = realtime_to_ingame_delta_formatted(user_data.hiscore_modern)
-        text = self.font.render(f"Highscore: {date}", True, Color.blue)
+        text = text_cache.render(f"Highscore: {date}", 40, Color.blue)
 
         self.screen.blit(text, (0, HEIGHT - text.get_height() - 10))
@@ -13,6 +13,14 @@ FPS: float = 60
 WIDTH: int = 960
 HEIGHT: int = 720
 
+# Update only the changed parts of the screen, instead of flipping the whole screen.
+DIRTY_RECTS: bool = True
+# Part of the screen area - if more has changed, the whole screen is flipped.
+DIRTY_RECTS_MAX_AREA: float = 0.5
+
+# How many rendered text images are kept in cache.
+TEXT_CACHE_SIZE: int = 256
+
 # Print debug information about game function calls.
 # Will need to set LOG_LEVEL to debug to see the results.
 PROFILING: bool = False
@@ -11,11 +11,18 @@ from project.UI.page.options import Options
 from project.constants import Color, FPS, HEIGHT, WIDTH, WindowState
 from project.gameplay.game_state import GameState
 from project.gameplay.game_view import GameView
+from project.gameplay.tictactoe import TicTacToe
+from project.utils.asset_cache import AssetCache
+from project.utils.dirty_rects import DirtyRects
+from project.utils.text_cache import TextCache
 from project.utils.user_data import UserData
 
 
 logger = logging.getLogger(__name__)
+asset_cache = AssetCache()
+dirty_rects = DirtyRects()
 game_vars = GameState()
+text_cache = TextCache()
 user_data = UserData()
 
 
@@ -42,6 +49,10 @@ class Game:
         self.options = Options(self.screen)
         self.credits = Credits(self.screen)
         self.gameover = GameOver(self.screen)
+
+        # Solve tic tac toe before the game starts, not when the first task spawns
+        TicTacToe.get(3, 3)
+
         self.reset()
 
     def reset(self) -> None:
@@ -50,8 +61,12 @@ class Game:
             game_vars.reset(self.game_view.period)
 
         self.window_state = WindowState.main_menu
+        self.last_window_state = None
         self.game_view = GameView(self.screen)
 
+        asset_cache.log_stats()
+        text_cache.log_stats()
+
     def run(self) -> None:
         """Draw and get events."""
         self.clock.tick(FPS)
@@ -74,6 +89,11 @@ class Game:
         """Root draw function which runs once every game tick."""
         self.game_view.update(self.event)
 
+        # Changing window - new page will be drawn over the whole screen
+        if self.window_state != self.last_window_state:
+            self.last_window_state = self.window_state
+            dirty_rects.add_screen()
+
         if self.window_state == WindowState.main_menu:
             self.game_view.draw(self.event)
             self.window_state = self.main_menu.draw(
@@ -102,10 +122,10 @@ class Game:
         if user_data.show_fps:
             self._draw_fps()
 
-        pg.display.flip()
+        dirty_rects.present()
 
     def _draw_fps(self) -> None:
         """Draw fps indicator in the corner of the screen."""
-        font = pg.font.Font(None, 50)
-        fps_indicator = font.render(str(int(self.clock.get_fps())), True, Color.orange)
-        self.screen.blit(fps_indicator, (WIDTH - fps_indicator.get_width(), 0))
+        fps = str(int(self.clock.get_fps()))
+        atlas = text_cache.atlas(50, Color.orange)
+        dirty_rects.add(atlas.draw(self.screen, fps, (WIDTH - atlas.size(fps)[0], 0)))
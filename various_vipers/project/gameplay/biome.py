@@ -1,9 +1,7 @@
 import logging
 import random
 from pathlib import PurePath
-from typing import Callable, Generator, List, Tuple
-
-from pygame.transform import scale
+from typing import Callable, Dict, Generator, List, Set, Tuple
 
 from project.constants import (
     BIOME_WIDTH,
@@ -21,12 +19,16 @@ from project.constants import (
     TILE_ROWS,
 )
 from project.utils.helpers import load_img
+from project.utils.random_set import RandomSet
 from .task import Task
 from .tile import Tile
 
 
 logger = logging.getLogger(__name__)
 
+# (y, x) coordinates of a tile in tilemap
+Coords = Tuple[int, int]
+
 
 class Biome(object):
     """Abstract Biome class for all biome relevant information."""
@@ -58,10 +60,9 @@ class Biome(object):
         self.tilemap = self.Tilemap(self, TILE_COLS, TILE_ROWS)
 
         # scale background to 0.8 of screen height
-        self.background = load_img(random.choice(self.background_images), False)
-        scale_percent = BIOME_WIDTH / self.background.get_width()
-        new_height = int(self.background.get_height() * scale_percent)
-        self.background = scale(self.background, (BIOME_WIDTH, new_height))
+        self.background = load_img(
+            random.choice(self.background_images), False, (BIOME_WIDTH, None)
+        )
 
     @property
     def color(self) -> Tuple[Color, Color]:
@@ -95,12 +96,27 @@ class Biome(object):
 
         def __init__(self, biome: "Biome", width: int = 10, height: int = 4):
             self.biome = biome
+            # Increased each time a tile gets or loses a task
+            self.revision = 0
+            # Tiles with a task - the only ones that need updating
+            self.active_tiles: Set[Tile] = set()
 
-            self._task_coords = []  # List of tuples (y, x) for which tiles has a task
             self._tiles = []
             for _ in range(height):
                 self._tiles.append(list(self.__choose_tiles(width)))
 
+            # Tile -> (y, x) coordinates of the tile
+            self._coords: Dict[Tile, Coords] = {
+                tile: (y, x)
+                for y, row in enumerate(self._tiles)
+                for x, tile in enumerate(row)
+            }
+            # Coordinates (y, x) of tiles with a task, in order tasks were added
+            # (dict is used as an ordered set)
+            self._task_coords: Dict[Coords, None] = {}
+            # Coordinates (y, x) of tiles without a task
+            self._free_coords: RandomSet[Coords] = RandomSet(self._coords.values())
+
         @property
         def rows(self) -> Generator[Tile, None, None]:
             """Get rows of this tilemap."""
@@ -124,31 +140,46 @@ class Biome(object):
             """Get task count in this biome."""
             return len(self._task_coords)
 
+        @property
+        def free_count(self) -> int:
+            """Get count of tiles without a task in this biome."""
+            return len(self._free_coords)
+
+        def random_free_coords(self) -> Coords:
+            """Get (y, x) coordinates of a random tile without a task."""
+            return self._free_coords.choice()
+
+        def coords_of(self, tile: Tile) -> Coords:
+            """Get (y, x) coordinates of the tile in this biome."""
+            return self._coords[tile]
+
         def set_task_by_coords(self, y: int, x: int, task: Task) -> None:
             """Add a task to tile in this biome. Find tile by coordinates."""
-            self._task_coords.append((y, x))
+            self._task_coords[(y, x)] = None
+            self._free_coords.discard((y, x))
             self._tiles[y][x].task = task
 
         def set_task_by_tile(self, tile: Tile, task: Task) -> None:
             """Add a task to tile in this biome."""
-            for y, row in enumerate(self._tiles):
-                for x, row_tile in enumerate(row):
-                    if tile == row_tile:
-                        self.set_task_by_coords(y, x, task)
-                        return
+            self.set_task_by_coords(*self._coords[tile], task)
 
         def del_task_by_coords(self, y: int, x: int) -> None:
             """Remove a task from the tile in this biome. Find tile by coordintes."""
-            self._task_coords.remove((y, x))
+            del self._task_coords[(y, x)]
+            self._free_coords.add((y, x))
             self._tiles[y][x].task = None
 
         def del_task_by_tile(self, tile: Tile) -> None:
             """Remove a task from the tile in this biome."""
-            for y, row in enumerate(self._tiles):
-                for x, row_tile in enumerate(row):
-                    if tile == row_tile:
-                        self.del_task_by_coords(y, x)
-                        return
+            self.del_task_by_coords(*self._coords[tile])
+
+        def tile_changed(self, tile: Tile) -> None:
+            """Called when a tile in this biome gets or loses a task."""
+            self.revision += 1
+            if tile.task is not None:
+                self.active_tiles.add(tile)
+            else:
+                self.active_tiles.discard(tile)
 
         def __iter__(self):
             """Iterate through tiles in this biome."""
@@ -187,7 +218,7 @@ class Biome(object):
             )
 
             for tile_list in chosen_tile_lists:
-                yield Tile(str(random.choice(tile_list)))
+                yield Tile(str(random.choice(tile_list)), self)
 
 
 class BiomeDesert(Biome):
@@ -0,0 +1,77 @@
+import logging
+import random
+from typing import List, Set
+
+import pygame as pg
+
+from project.constants import WIDTH
+
+
+logger = logging.getLogger(__name__)
+
+
+class CloudLayer:
+    """
+    Endless horizontally scrolling layer of random clouds.
+
+    Clouds are kept in a fixed ring of slots, pre-rendered side by side into one strip.
+    Strip wraps around, so the layer is drawn with one or two blits.
+    When a cloud slot scrolls off the screen it gets a new random cloud -
+      slots are only rendered again while they are off the screen,
+      so the change is never seen.
+    """
+
+    def __init__(self, images: List[pg.Surface], y: int):
+        self.images = images
+        self.y = y
+
+        self.slot_width = max(image.get_width() for image in images)
+        # Enough slots to cover the whole screen at any offset
+        self.capacity = -(-WIDTH // self.slot_width) + 1
+        self.strip_width = self.slot_width * self.capacity
+
+        # Index of cloud image in each slot
+        self.clouds: List[int] = [0] * self.capacity
+        self.strip = pg.Surface(
+            (self.strip_width, max(image.get_height() for image in images)),
+            pg.SRCALPHA,
+        )
+        for slot in range(self.capacity):
+            self.__new_cloud(slot)
+
+        # Strip x position that is drawn at the left edge of the screen
+        self.offset = 0.0
+        self.visible_slots = self.__visible_slots()
+
+    def scroll(self, dx: float) -> None:
+        """Move clouds by dx pixels (positive is to the right)."""
+        self.offset = (self.offset - dx) % self.strip_width
+
+        visible_slots = self.__visible_slots()
+        # Slots that just left the screen get new clouds
+        for slot in self.visible_slots - visible_slots:
+            self.__new_cloud(slot)
+        self.visible_slots = visible_slots
+
+    def draw(self, screen: pg.Surface) -> None:
+        """Draw the layer - strip is drawn again after itself, if it ends on the screen."""
+        x = -int(self.offset)
+        screen.blit(self.strip, (x, self.y))
+        if x + self.strip_width < WIDTH:
+            screen.blit(self.strip, (x + self.strip_width, self.y))
+
+    def __visible_slots(self) -> Set[int]:
+        """Returns slots that are at least partially on the screen."""
+        first = int(self.offset // self.slot_width)
+        last = int(-(-(self.offset + WIDTH) // self.slot_width))
+        return {slot % self.capacity for slot in range(first, last)}
+
+    def __new_cloud(self, slot: int) -> None:
+        """Put a random cloud into the slot and render it onto the strip."""
+        self.clouds[slot] = random.randrange(len(self.images))
+
+        slot_rect = pg.Rect(
+            slot * self.slot_width, 0, self.slot_width, self.strip.get_height()
+        )
+        self.strip.fill((0, 0, 0, 0), slot_rect)
+        self.strip.blit(self.images[self.clouds[slot]], slot_rect)
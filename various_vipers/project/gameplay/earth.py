@@ -1,19 +1,18 @@
 import logging
-import random
-from typing import Any, List, Tuple
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Generator, List, Optional, Set, Tuple
 
 import pygame as pg
 
 from project.constants import (
     BG_CLOUDS_SCROLL_SPEED,
     BG_SCROLL_SPEED,
-    BIOME_WIDTH,
     CLOUD_LAYERS_BG,
     CLOUD_LAYERS_FG,
     Color,
     FG_CLOUDS_SCROLL_SPEED,
     HEIGHT,
-    INDICATOR_ARROW,
     MAX_HEAT,
     OZONE_LAYER,
     TILE_COLS,
@@ -22,11 +21,15 @@ from project.constants import (
     WIDTH,
 )
 from project.utils.helpers import fit_to_range, load_img
+from project.utils.render_queue import RenderQueue
 from project.utils.user_data import UserData
 from .biome import Biome
+from .cloud_layer import CloudLayer
 from .game_state import GameState
-from .indicator import Indicator
+from .indicator import IndicatorManager
 from .sun import Sun
+from .task_registry import TaskRegistry
+from .tile import Tile, TileSprite
 
 
 logger = logging.getLogger(__name__)
@@ -45,41 +48,73 @@ class Earth(object):
     entry_y_offset: float = HEIGHT // 3
     entry_speed: float = entry_y_offset // 50
 
-    def __init__(self, screen: pg.Surface, biomes: List[Biome]):
+    # Heat is split into this many levels - polution overlay only changes between levels
+    polution_levels: int = 25
+    # How far (in levels) heat has to move past a level boundary to change the level
+    polution_hysteresis: float = 0.5
+    # Max alpha of ozone layer and polution
+    ozone_max_alpha: int = 50
+    polution_max_alpha: int = 150
+
+    # How far breathing tiles can stick out of their column on each side
+    tile_overhang: int = (
+        int(TILE_WIDTH * TileSprite.scale_n_max * TileSprite.breathing_speed) // 2 + 1
+    )
+
+    def __init__(self, screen: pg.Surface, biomes: List[Biome], tasks: TaskRegistry):
         self.screen = screen
 
         self.biomes = biomes
+        self.biome_indexes = {biome: i for i, biome in enumerate(self.biomes)}
+        self.tasks = tasks
 
         # Background cloud layer
-        self.cloud_layers_bg_pool = [load_img(image) for image in CLOUD_LAYERS_BG]
-        self.cloud_layers_bg = []
-        self.current_cloud_bg_pos = 0
+        self.cloud_layer_bg = CloudLayer(
+            [load_img(image) for image in CLOUD_LAYERS_BG], int(HEIGHT // 4)
+        )
 
         # Foreground (in front of background :)) cloud layer
-        self.cloud_layers_fg_pool = [load_img(image) for image in CLOUD_LAYERS_FG]
-        self.cloud_layers_fg = []
-        self.current_cloud_fg_pos = 0
+        self.cloud_layer_fg = CloudLayer(
+            [load_img(image) for image in CLOUD_LAYERS_FG], int(HEIGHT // 3)
+        )
 
         # Ozone layer (purple line)
-        self.ozone_image = load_img(OZONE_LAYER)
-        self.ozone_image = pg.transform.scale(self.ozone_image, (WIDTH, HEIGHT // 10))
+        self.ozone_image = load_img(OZONE_LAYER, size=(WIDTH, HEIGHT // 10))
         self.ozone_pos = (0, int(HEIGHT // 3))
+        # Ozone images with alpha of each polution level - made when level is reached
+        self.ozone_images: Dict[int, pg.Surface] = {}
 
         # Polution (yellow screen tint)
-        self.polution_image = pg.Surface(
-            (WIDTH, int(2 * HEIGHT // 3) - self.ozone_image.get_rect().h // 2)
+        self.polution_size = (
+            WIDTH,
+            int(2 * HEIGHT // 3) - self.ozone_image.get_rect().h // 2,
         )
-        self.polution_image.fill(Color.desert)
-        self.polution_pos = (0, HEIGHT - self.polution_image.get_height())
+        self.polution_pos = (0, HEIGHT - self.polution_size[1])
+        # Polution images with alpha of each polution level - made when level is reached
+        self.polution_images: Dict[int, pg.Surface] = {}
+        self.polution_level = 0
 
-        self.indicator_image = load_img(INDICATOR_ARROW)
-        self.indicators = []
+        self.visible_tiles = set()
+        # Tile under the mouse
+        self.hovered_tile = None
 
-        self.visible_tiles = []
+        # Visible tiles draws of the current frame, in painter's order
+        self.tile_queue = RenderQueue()
+
+        # Baked biome images - biome index ->
+        #   (tilemap revisions, image, top y, [(row restore image, y)])
+        self.biome_chunks = {}
 
         self.current_biome_pos = 0
+        # World position where each biome starts, followed by the world length
+        self.biome_offsets = [0] + list(
+            accumulate(biome.background.get_width() for biome in self.biomes)
+        )
         # Calculate max position by added the width of all bg images
-        self.max_position = sum(biome.background.get_width() for biome in self.biomes)
+        self.max_position = self.biome_offsets[-1]
+
+        # Indicators pointing to tasks that are not visible
+        self.indicators = IndicatorManager(self.screen, self.max_position)
 
     def update(self, event: pg.event) -> None:
         """Update game logic with each game tick."""
@@ -101,8 +136,8 @@ class Earth(object):
             else:
                 game_vars.open_task.update(event)
 
-        self.current_cloud_bg_pos += BG_CLOUDS_SCROLL_SPEED
-        self.current_cloud_fg_pos += FG_CLOUDS_SCROLL_SPEED
+        self.cloud_layer_bg.scroll(BG_CLOUDS_SCROLL_SPEED)
+        self.cloud_layer_fg.scroll(FG_CLOUDS_SCROLL_SPEED)
 
         self.__update_positions()
         self.__update_indicators()
@@ -114,8 +149,7 @@ class Earth(object):
         # If the game was started - draw biomes and polution
         if game_vars.is_started:
             self.__draw_biomes()
-            if not user_data.boost_fps:
-                self.__draw_polution()
+            self.__draw_polution()
 
         sun.draw()  # Need to draw sun before indicators
 
@@ -126,149 +160,231 @@ class Earth(object):
             game_vars.open_task.draw()
 
     def fix_indicators(self) -> None:
-        """Will add missing indicators. Should be called when indicator could appear."""
-        # Loop through all tiles. If tile has task, but no indicator - add it
-        for biome_idx, biome in enumerate(self.biomes):
-            for tile in biome.tilemap.tiles_with_task:
-                indicator = next((i for i in self.indicators if i.tile == tile), None)
-
-                # If tile is visible - dont need indicator
-                if tile in self.visible_tiles:
-                    if indicator:
-                        self.indicators.remove(indicator)
-                    continue
-
-                if indicator is None:
-                    indicator = Indicator(self.screen, tile, self.indicator_image)
-                    self.indicators.append(indicator)
-
-                # Calculate if the tile is to the left or right of the screen
-                biome_pos = biome_idx * BIOME_WIDTH
-                if self.current_biome_pos < biome_pos:
-                    distance_left = (
-                        self.max_position - biome_pos + self.current_biome_pos
-                    )
-                    distance_right = biome_pos - self.current_biome_pos
-                else:
-                    distance_left = self.current_biome_pos - biome_pos
-                    distance_right = (
-                        self.max_position - self.current_biome_pos + biome_pos
-                    )
-                indicator.flip(distance_left <= distance_right)
-
-    def __prepare_draw_clouds(
-        self,
-        pool: List[pg.Surface],
-        current_list: List[pg.Surface],
-        x_pos: int,
-        y_pos: int = 0,
-    ) -> List[Any]:
-        """
-        Logic to handle drawing a single cloud plane.
-
-        Returns a list of Surface draw arguments to draw later.
-        """
-        draw_args = []
-        offset = x_pos
-
-        for i, cloud in enumerate(current_list):
-            draw_args.append([cloud, (offset, y_pos)])
-            offset += cloud.get_width()
-
-            # Remove clouds that are offscreen to the right
-            if offset > WIDTH:
-                current_list = current_list[:i]
-                break
-
-        # Add new clouds to fill the rest of the screen
-        while offset < WIDTH:
-            new_cloud = random.choice(pool)
-            current_list.append(new_cloud)
-            draw_args.append([new_cloud, (offset, y_pos)])
-            offset += new_cloud.get_width()
-
-        return draw_args
+        """Will add, remove and flip indicators. Should be called when camera moves."""
+        self.indicators.sync(self.visible_tiles, self.current_biome_pos + WIDTH // 2)
+
+    def task_added(self, biome: Biome, tile: Tile) -> None:
+        """Add indicator for task that was added to the tile."""
+        y, x = biome.tilemap.coords_of(tile)
+        # Every second row has x offset to fit isometric tiles
+        row_offset = int(TILE_WIDTH // 2) if y % 2 != 0 else 0
+        position = (
+            self.biome_offsets[self.biome_indexes[biome]]
+            + x * TILE_WIDTH
+            + row_offset
+            + TILE_WIDTH // 2
+        )
+        self.indicators.add(tile, position)
+        self.fix_indicators()
 
     def __draw_clouds(self) -> None:
         """Draw cloud layers."""
-        draw_bg_args = self.__prepare_draw_clouds(
-            self.cloud_layers_bg_pool,
-            self.cloud_layers_bg,
-            self.current_cloud_bg_pos,
-            int(HEIGHT // 4),
-        )
-        self.screen.blits(draw_bg_args)
+        self.cloud_layer_bg.draw(self.screen)
+        self.cloud_layer_fg.draw(self.screen)
 
-        draw_fg_args = self.__prepare_draw_clouds(
-            self.cloud_layers_fg_pool,
-            self.cloud_layers_fg,
-            self.current_cloud_fg_pos,
-            int(HEIGHT // 3),
-        )
-        self.screen.blits(draw_fg_args)
+    def __tiles_y(self, rows: int) -> int:
+        """Returns y position of the first tile row, for tilemap with given rows count."""
+        return HEIGHT - int((TILE_WIDTH * rows) // 1.5)
+
+    def __pick_tile(
+        self, mouse_x: int, mouse_y: int
+    ) -> Optional[Tuple[Biome, int, int]]:
+        """
+        Returns (biome, row, column) of the tile under the mouse, or None.
+
+        Isometric layout is inverted to find the few tiles that can be under the mouse.
+        Those are checked against tile masks - from the tile drawn last to the first.
+        """
+        column_count = len(self.biomes) * TILE_COLS
+        world_x = (mouse_x + self.current_biome_pos) % self.max_position
+        tiles_y = self.__tiles_y(TILE_ROWS) + self.entry_y_offset
+
+        # Later rows are drawn over the previous ones
+        for y in reversed(range(TILE_ROWS)):
+            # Every second row has x offset to fit isometric tiles
+            row_x = world_x - (int(TILE_WIDTH // 2) if y % 2 != 0 else 0)
+            column = int(row_x // TILE_WIDTH)
+
+            # Scaled up tiles can overlap neighbors in the same row
+            for world_column in (column + 1, column, column - 1):
+                biome_idx, x = divmod(world_column % column_count, TILE_COLS)
+                tile = self.biomes[biome_idx].tilemap[y][x]
+                width, height = tile.image.get_size()
+
+                # Mouse position relative to the tile image
+                local_x = row_x - world_column * TILE_WIDTH + (width - TILE_WIDTH) // 2
+                local_y = (
+                    mouse_y - tiles_y - y * int(TILE_WIDTH // 2) + (height - TILE_WIDTH)
+                )
+                if tile.is_hit(int(local_x), int(local_y)):
+                    return self.biomes[biome_idx], y, x
 
-    def __prepare_draw_background(self, biome: Biome, biome_x: int) -> List[List[Any]]:
-        """Returns list of parameters lists how to draw biome background."""
-        biome_y = HEIGHT - biome.background.get_height() + self.entry_y_offset
-        return [[biome.background, (biome_x, biome_y)]]
+        return None
 
-    def __prepare_draw_tiles(self, biome: Biome, biome_x: int) -> List[List[Any]]:
-        """Returns list of parameters lists how to draw biomes tiles."""
-        draw_args = []
+    def __layout_tiles(
+        self,
+        biome: Biome,
+        biome_x: int,
+        y_offset: float = 0,
+        visible_only: bool = False,
+        idle: bool = False,
+    ) -> Generator[Tuple[int, Tile, pg.Surface, int, int], None, None]:
+        """
+        Yields (row, tile, image, x, y) of biome tiles in isometric layout.
 
-        tile_y = HEIGHT - int((TILE_WIDTH * len(biome.tilemap)) // 1.5)
+        visible_only - skip columns that can not reach the screen, before any image work.
+        idle - lay out idle images of tiles, instead of their current images.
+        """
+        tile_y = self.__tiles_y(len(biome.tilemap))
 
         for y, tiles_row in enumerate(biome.tilemap):
             # Every second row needs x offset to fit isometric tiles
             offset = int(TILE_WIDTH // 2)
+            row_x = biome_x + (offset if y % 2 != 0 else 0)
 
-            tile_x = offset if y % 2 != 0 else 0
-            for tile in tiles_row:
-                tile_image = tile.image
+            if visible_only:
+                first, last = self.__visible_columns(row_x, len(tiles_row))
+            else:
+                first, last = 0, len(tiles_row)
+
+            tile_x = row_x + first * TILE_WIDTH
+            for tile in tiles_row[first:last]:
+                tile_image = tile.idle_image if idle else tile.image
                 # Horizontally centered in it's possition
-                draw_x = biome_x + tile_x - (tile_image.get_width() - TILE_WIDTH) // 2
+                draw_x = tile_x - (tile_image.get_width() - TILE_WIDTH) // 2
                 # Vertical align to bottom - will expand upwards
-                draw_y = (
-                    tile_y
-                    - (tile_image.get_height() - TILE_WIDTH)
-                    + self.entry_y_offset
-                )
-                tile.pos_x = draw_x
-                tile.pos_y = draw_y
-                draw_args.append([tile_image, (draw_x, draw_y)])
+                draw_y = tile_y - (tile_image.get_height() - TILE_WIDTH) + y_offset
+                yield y, tile, tile_image, draw_x, draw_y
                 tile_x += TILE_WIDTH
 
-                # If tile is on screen add it to visible tiles list
-                if draw_x + tile_image.get_width() > 0 and draw_x < WIDTH:
-                    self.visible_tiles.append(tile)
-
             tile_y += offset
 
-        return draw_args
+    def __visible_columns(self, row_x: int, columns: int) -> Tuple[int, int]:
+        """
+        Returns range [first, last) of row columns that can be on the screen.
+
+        Range is widened by the largest overflow of breathing tiles.
+        """
+        first = (-row_x - TILE_WIDTH - self.tile_overhang) // TILE_WIDTH + 1
+        last = -((row_x - WIDTH - self.tile_overhang) // TILE_WIDTH)
+        return max(0, int(first)), min(columns, int(last))
+
+    def __prepare_draw_tiles(self, biome: Biome, biome_x: int) -> Set[int]:
+        """
+        Queue draws of biome tiles. Returns rows that have live tiles.
+
+        Tiles are drawn from the queue only from the first row with live tiles,
+          rows behind it are drawn from biome chunks.
+        Only tiles in columns that can reach the screen are checked.
+        """
+        live_rows = set()
+        layout = self.__layout_tiles(
+            biome, biome_x, self.entry_y_offset, visible_only=True
+        )
+        for y, tile, tile_image, draw_x, draw_y in layout:
+            self.tile_queue.add(y, draw_x, draw_y, tile_image)
+            if tile.is_live:
+                live_rows.add(y)
 
-    def __prepare_draw_biome(
-        self, biome: Biome, biome_x: int
-    ) -> Tuple[List[List[Any]], List[List[Any]]]:
+            # If tile is on screen add it to visible tiles list
+            if draw_x + tile_image.get_width() > 0 and draw_x < WIDTH:
+                self.visible_tiles.add(tile)
+
+        return live_rows
+
+    def __get_chunk(
+        self, biome_idx: int
+    ) -> Tuple[pg.Surface, int, List[Tuple[pg.Surface, int]]]:
+        """
+        Returns baked image of the biome, its top y position and row restore images.
+
+        Chunk holds biome background and every tile without a task.
+        Tiles overlap into neighbor biomes, so chunk is baked again
+          when tasks of tiles in this or neighbor biome change.
         """
-        Logic to handle drawing a single biome and its related objects.
+        neighbors = [
+            self.biomes[(biome_idx + i) % len(self.biomes)] for i in (-1, 0, 1)
+        ]
+        revisions = tuple(biome.tilemap.revision for biome in neighbors)
 
-        Returns a tuple of background and tile draw arguments lists to draw later.
+        chunk = self.biome_chunks.get(biome_idx)
+        if chunk is None or chunk[0] != revisions:
+            chunk = (revisions, *self.__bake_chunk(*neighbors))
+            self.biome_chunks[biome_idx] = chunk
+
+        return chunk[1:]
+
+    def __bake_chunk(
+        self, left: Biome, biome: Biome, right: Biome
+    ) -> Tuple[pg.Surface, int, List[Tuple[pg.Surface, int]]]:
         """
-        # Background
-        draw_bg_args = self.__prepare_draw_background(biome, biome_x)
-        # Tiles
-        draw_tile_args = self.__prepare_draw_tiles(biome, biome_x)
+        Draw biome background and tiles onto a single image.
 
-        return draw_bg_args, draw_tile_args
+        Returns image, its top y and (image, y) of restore image for each row.
+        Restore image covers the chunk from the top of its row down,
+          with only the background and rows behind it drawn.
+        Rows from the first row with live tiles are drawn tile by tile over it,
+          so live tiles keep painter's order with the tiles in front of them.
+        """
+        background_y = HEIGHT - biome.background.get_height()
+
+        queue = RenderQueue()
+        top = background_y
+        # Top y of each row
+        row_tops: List[int] = []
+        for neighbor, neighbor_x in [
+            (left, -left.background.get_width()),
+            (biome, 0),
+            (right, biome.background.get_width()),
+        ]:
+            for y, tile, tile_image, draw_x, draw_y in self.__layout_tiles(
+                neighbor, neighbor_x, idle=True
+            ):
+                if tile.task is None:
+                    queue.add(y, draw_x, draw_y, tile_image)
+
+                if y == len(row_tops):
+                    row_tops.append(draw_y)
+                row_tops[y] = min(row_tops[y], draw_y)
+                # Chunk stretches up to the highest tile, if it is above the background
+                top = min(top, draw_y)
+
+        chunk = pg.Surface((biome.background.get_width(), HEIGHT - top), pg.SRCALPHA)
+        chunk.blit(biome.background, (0, background_y - top))
+
+        restores = []
+        # Draw one row at a time, between neighbor biomes to avoid isometric tile clipping
+        for y, row_top in enumerate(row_tops):
+            restore_rect = pg.Rect(
+                0, row_top - top, chunk.get_width(), HEIGHT - row_top
+            )
+            restores.append((chunk.subsurface(restore_rect).copy(), row_top))
+            chunk.blits(queue.row_draws(y, -top), False)
+
+        # Background is not transparent - images can be converted to faster format
+        if top == background_y:
+            chunk = chunk.convert()
+            restores = [(image.convert(), y) for image, y in restores]
+
+        return chunk, top, restores
 
     def __draw_biomes(self) -> None:
         """Draw biomes related images - will draw as little as possible to fill the screen."""
-        self.visible_tiles = []
+        self.visible_tiles = set()
         # Saving draw calls to buffer and draw later - so we can draw all BG items before FG
-        background_draws = []
-        tile_draws = []
+        chunk_draws = []
+        # Restore images draws of each row
+        restore_draws: List[List[Tuple[pg.Surface, Tuple[float, float]]]] = []
+        self.tile_queue.clear()
         # Get first biome to draw from
         i, biome_x = self.__find_first_biome()
+
+        # Tiles of neighbor biomes can stick out onto the screen
+        previous = self.biomes[i - 1]
+        live_rows = self.__prepare_draw_tiles(
+            previous, biome_x - previous.background.get_width()
+        )
+
         # From the first BG image, draw new images to the right, until whole screen is filled
         while True:
             if i > len(self.biomes) - 1:
@@ -276,66 +392,110 @@ class Earth(object):
                 i = 0
 
             biome = self.biomes[i]
-            image = biome.background
-            bg_draws, fg_draws = self.__prepare_draw_biome(biome, biome_x)
-            background_draws += bg_draws
-            tile_draws += fg_draws
+            chunk, chunk_y, restores = self.__get_chunk(i)
+            chunk_draws.append((chunk, (biome_x, chunk_y + self.entry_y_offset)))
+            for y, (restore, restore_y) in enumerate(restores):
+                if y == len(restore_draws):
+                    restore_draws.append([])
+                restore_draws[y].append(
+                    (restore, (biome_x, restore_y + self.entry_y_offset))
+                )
+            live_rows |= self.__prepare_draw_tiles(biome, biome_x)
 
-            biome_x += image.get_width()
+            biome_x += biome.background.get_width()
             if biome_x > WIDTH:
                 break
 
             i += 1
 
-        self.screen.blits(background_draws)
+        live_rows |= self.__prepare_draw_tiles(
+            self.biomes[(i + 1) % len(self.biomes)], biome_x
+        )
+
+        self.screen.blits(chunk_draws, False)
+        if not live_rows:
+            return
 
+        # Tiles in front of live tiles have to be drawn after them -
+        #   from the first row with live tiles, chunks are restored and drawn tile by tile
+        first_row = min(live_rows)
+        self.screen.blits(restore_draws[first_row], False)
         # Need to draw one row at a time, between all biomes to avoid isometric tile clipping
-        # Because the initial map is grouped by biomes, we need to do some magic to group by rows
-        new_tile_draws = []
-        for y in range(TILE_ROWS):
-            for x in range(TILE_COLS - 1):
-                start = TILE_COLS * TILE_ROWS * x + TILE_COLS * y
-                end = start + TILE_COLS
-                new_tile_draws += tile_draws[start:end]
-        self.screen.blits(new_tile_draws)
+        for row in range(first_row, len(restore_draws)):
+            self.screen.blits(self.tile_queue.row_draws(row), False)
 
     def __find_first_biome(self) -> Tuple[int, float]:
         """
         Function returns index, and position of first biome that should be drawn on the left.
 
         Screen and individual images widths are taken into account when finding the first biome.
+        Biome is found with binary search in biomes start positions.
         """
-        _position = 0
-        i = 0
-        while i < len(self.biomes):
-            image = self.biomes[i].background
+        # First biome that ends to the right of the screen left edge
+        i = max(0, bisect_right(self.biome_offsets, self.current_biome_pos) - 1)
+        return (i, self.biome_offsets[i] - self.current_biome_pos)
 
-            if _position - self.current_biome_pos + image.get_width() > 0:
-                break
+    def __draw_polution(self) -> None:
+        """
+        Draw ozone layer and polution (yellow tint).
 
-            _position += image.get_width()
-            i += 1
+        Transparency of both depends on current heat, quantized to polution levels.
+        Images of each level are made once - level change only swaps drawn images.
+        """
+        self.polution_level = self.__polution_level()
 
-        return (i, _position - self.current_biome_pos)
+        # Nothing to draw without any heat
+        if self.polution_level == 0:
+            return
 
-    def __draw_polution(self) -> None:
-        """Draw ozone layer and polution (yellow tint)."""
-        # Ozone layer - horizontal line, transparency depends on current heat.
-        ozone_alpha = fit_to_range(game_vars.current_heat, 0, MAX_HEAT, 0, 50)
-        _ozone = self.ozone_image.copy()
-        _ozone.fill((255, 255, 255, ozone_alpha), None, pg.BLEND_RGBA_MULT)
+        # Full screen tint is skipped when boosting FPS - ozone layer is cheap
+        if not user_data.boost_fps:
+            self.screen.blit(
+                self.__polution_image(self.polution_level), self.polution_pos
+            )
+        self.screen.blit(self.__ozone_image(self.polution_level), self.ozone_pos)
 
-        # Polution - yellow transparent background fill indicating toxic air.
-        polution_alpha = fit_to_range(game_vars.current_heat, 0, MAX_HEAT, 0, 150)
-        self.polution_image.set_alpha(polution_alpha)
+    def __polution_level(self) -> int:
+        """
+        Returns polution level (0 - polution_levels) of current heat.
 
-        self.screen.blit(self.polution_image, self.polution_pos)
-        self.screen.blit(_ozone, self.ozone_pos)
+        Level is kept until heat moves polution_hysteresis levels past its boundary,
+          so heat going back and forth around a boundary does not switch levels.
+        """
+        heat = min(max(game_vars.current_heat, 0), MAX_HEAT)
+        level = fit_to_range(heat, 0, MAX_HEAT, 0, self.polution_levels)
+        if abs(level - self.polution_level) <= 0.5 + self.polution_hysteresis:
+            return self.polution_level
+        return round(level)
+
+    def __polution_image(self, level: int) -> pg.Surface:
+        """Polution - yellow transparent fill indicating toxic air, for polution level."""
+        image = self.polution_images.get(level)
+        if image is None:
+            alpha = fit_to_range(
+                level, 0, self.polution_levels, 0, self.polution_max_alpha
+            )
+            image = pg.Surface(self.polution_size).convert()
+            image.fill(Color.desert)
+            image.set_alpha(int(alpha))
+            self.polution_images[level] = image
+        return image
+
+    def __ozone_image(self, level: int) -> pg.Surface:
+        """Ozone layer - horizontal line, transparency depends on polution level."""
+        image = self.ozone_images.get(level)
+        if image is None:
+            alpha = fit_to_range(
+                level, 0, self.polution_levels, 0, self.ozone_max_alpha
+            )
+            image = self.ozone_image.copy()
+            image.fill((255, 255, 255, int(alpha)), None, pg.BLEND_RGBA_MULT)
+            self.ozone_images[level] = image
+        return image
 
     def __draw_indicators(self) -> None:
         """Draw indicators showing tasks positions."""
-        for indicator in self.indicators:
-            indicator.draw()
+        self.indicators.draw()
 
     def __draw_notification(self) -> None:
         """Draw notification text."""
@@ -345,47 +505,53 @@ class Earth(object):
     def __scroll_left(self) -> None:
         """Camera moving left."""
         self.current_biome_pos -= BG_SCROLL_SPEED
-        self.current_cloud_bg_pos += BG_CLOUDS_SCROLL_SPEED
-        self.current_cloud_fg_pos += FG_CLOUDS_SCROLL_SPEED
+        self.cloud_layer_bg.scroll(BG_CLOUDS_SCROLL_SPEED)
+        self.cloud_layer_fg.scroll(FG_CLOUDS_SCROLL_SPEED)
         self.fix_indicators()
 
     def __scroll_right(self) -> None:
         """Camera moving right."""
         self.current_biome_pos += BG_SCROLL_SPEED
-        self.current_cloud_bg_pos -= BG_CLOUDS_SCROLL_SPEED * 2
-        self.current_cloud_fg_pos -= FG_CLOUDS_SCROLL_SPEED * 2
+        self.cloud_layer_bg.scroll(-BG_CLOUDS_SCROLL_SPEED * 2)
+        self.cloud_layer_fg.scroll(-FG_CLOUDS_SCROLL_SPEED * 2)
         self.fix_indicators()
 
     def __update_positions(self) -> None:
-        """Correct current biome and cloud positions based on min and max values."""
+        """Correct current biome position based on min and max values."""
         if self.current_biome_pos > self.max_position:
             self.current_biome_pos = 0
         elif self.current_biome_pos < 0:
             self.current_biome_pos = self.max_position
 
-        # Cloud position will always be the position of first cloud (offscreen to the left)
-        if self.current_cloud_bg_pos > 0:
-            self.cloud_layers_bg = [
-                random.choice(self.cloud_layers_bg_pool)
-            ] + self.cloud_layers_bg
-            self.current_cloud_bg_pos = -self.cloud_layers_bg[0].get_width()
-        if self.current_cloud_fg_pos > 0:
-            self.cloud_layers_fg = [
-                random.choice(self.cloud_layers_fg_pool)
-            ] + self.cloud_layers_fg
-            self.current_cloud_fg_pos = -self.cloud_layers_fg[0].get_width()
-
     def __update_tiles(self, event: pg.event) -> None:
-        """Calls update method of every tile in the game."""
+        """Handle hover and clicks on tiles and call update method of live tiles."""
+        picked = self.__pick_tile(*pg.mouse.get_pos())
+        tile = picked[0].tilemap[picked[1]][picked[2]] if picked else None
+
+        if tile is not self.hovered_tile:
+            if self.hovered_tile is not None:
+                self.hovered_tile.is_hovering = False
+            if tile is not None:
+                tile.is_hovering = True
+            self.hovered_tile = tile
+
+        # We clicked on tile - start the task
+        if (
+            tile is not None
+            and tile.task is not None
+            and event.type == pg.MOUSEBUTTONDOWN
+        ):
+            tile.task.start()
+
         for biome in self.biomes:
             tilemap = biome.tilemap
-            for y, tile_row in enumerate(tilemap):
-                for x, tile in enumerate(tile_row):
-                    if tile.task is not None and tile.task.is_done:
-                        tilemap.del_task_by_coords(y, x)
-                    tile.update(event)
+            # Copy - finished tasks are removed from active tiles
+            for tile in list(tilemap.active_tiles):
+                if tile.task is not None and tile.task.is_done:
+                    self.indicators.remove(tile)
+                    self.tasks.remove(tile.task)
+                tile.update()
 
     def __update_indicators(self) -> None:
         """Calls update method of every indicator."""
-        for indicator in self.indicators:
-            indicator.update()
+        self.indicators.update()
@@ -14,13 +14,17 @@ from project.constants import (
     WIDTH,
     WindowState,
 )
+from project.utils.dirty_rects import DirtyRects
 from project.utils.helpers import load_img
+from project.utils.text_cache import TextCache
 from .game_state import GameState
 from .period import PeriodFuture, PeriodMedieval, PeriodModern
 
 
 logger = logging.getLogger(__name__)
+dirty_rects = DirtyRects()
 game_vars = GameState()
+text_cache = TextCache()
 
 
 class GameView:
@@ -37,13 +41,14 @@ class GameView:
 
         # Delay before repeated pausing/unpausing of the game
         self.pause_start = 0
+        # Copy of the screen when the game was paused - world does not change while paused
+        self.paused_screen = None
 
         # Pause window
         self.window_rect = pg.Rect(
             int(WIDTH * 0.375), int(HEIGHT * 0.2), int(WIDTH * 0.25), int(HEIGHT * 0.5)
         )
-        self.window_image = load_img(PAUSE_WINDOW)
-        self.window_image = pg.transform.scale(self.window_image, self.window_rect.size)
+        self.window_image = load_img(PAUSE_WINDOW, size=self.window_rect.size)
 
         btn_height = 80
         btn_offset_x = 20
@@ -107,21 +112,28 @@ class GameView:
             Sound.game_over.play()
             return WindowState.gameover
 
-        self.period.draw()
-
         if game_vars.is_paused:
             self._draw_pause_window(event)
+        else:
+            self.paused_screen = None
+            self.period.draw()
 
         return None
 
     def _draw_pause_window(self, event: pg.event) -> None:
-        """Draw the pause window."""
+        """Draw the paused game and the pause window."""
+        # Draw the world once, then reuse it - only the pause window changes
+        if self.paused_screen is None:
+            self.period.draw()
+            self.paused_screen = self.screen.copy()
+        else:
+            self.screen.blit(self.paused_screen, (0, 0))
+        dirty_rects.add(self.window_rect)
+
         # Background
         self.screen.blit(self.window_image, self.window_rect)
 
-        font = pg.font.Font(None, 60)
-        font.set_bold(True)
-        pause_text = font.render("PAUSED", True, Color.white)
+        pause_text = text_cache.render("PAUSED", 60, Color.white, bold=True)
         text_x = (
             self.window_rect.x
             + (self.window_rect.width // 2)
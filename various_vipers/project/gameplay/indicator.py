@@ -1,10 +1,12 @@
 import logging
 import random
+from bisect import bisect_left, bisect_right
+from typing import Dict, Generator, List, Set, Tuple
 
 from pygame import Surface
-from pygame.transform import flip, scale
 
-from project.constants import HEIGHT, INDICATOR_WIDTH, WIDTH
+from project.constants import HEIGHT, INDICATOR_ARROW, INDICATOR_WIDTH, WIDTH
+from project.utils.helpers import load_img
 from .tile import Tile
 
 
@@ -18,21 +20,32 @@ class Indicator:
     max_x_offset: int = 30  # max x pulse offset from initial position
     pulse_speed: int = 3
 
-    def __init__(
-        self, screen: Surface, tile: Tile, image: Surface, is_left: bool = True
-    ):
+    # Arrow images shared by all indicators - is facing left -> image
+    _images: Dict[bool, Surface] = {}
+
+    def __init__(self, screen: Surface, tile: Tile, is_left: bool = True):
         self.screen = screen
+        self.reset(tile, is_left)
+
+    @classmethod
+    def image_for(cls, is_left: bool) -> Surface:
+        """Get arrow image facing left or right; scaled and flipped only once."""
+        image = cls._images.get(is_left)
+        if image is None:
+            image = cls._images[is_left] = load_img(
+                INDICATOR_ARROW, size=(INDICATOR_WIDTH, None), flip_x=not is_left
+            )
+        return image
+
+    def reset(self, tile: Tile, is_left: bool = True) -> None:
+        """(Re)initialize indicator for a tile, so pooled indicators can be reused."""
         self.tile = tile
         self.is_left = is_left  # Is facing left
 
         self.pulse_direction = int(self.is_left)
         self.current_offset = 0
 
-        self.image = image
-        scale_percent = INDICATOR_WIDTH / self.image.get_width()
-        new_height = int(self.image.get_height() * scale_percent)
-        self.image = scale(self.image, (INDICATOR_WIDTH, new_height))
-        self.image = flip(self.image, not self.is_left, False)
+        self.image = self.image_for(self.is_left)
 
         self.__update_pos()
 
@@ -49,7 +62,7 @@ class Indicator:
         """Set new position (left or right) for the indicator."""
         if self.is_left != to_left:
             self.is_left = to_left
-            self.image = flip(self.image, True, False)
+            self.image = self.image_for(self.is_left)
             self.__update_pos()
 
     def __update_pos(self) -> None:
@@ -66,3 +79,106 @@ class Indicator:
             self.pulse_direction = 1
 
         self.current_offset += self.pulse_speed * self.pulse_direction
+
+
+class IndicatorManager:
+    """
+    Keeps indicators for task tiles that are not visible on the screen.
+
+    Task tiles are kept sorted by their position on the world ring,
+      so sides of tasks are found with binary search.
+    Indicators that are no longer needed are kept in a pool and reused.
+    """
+
+    def __init__(self, screen: Surface, ring_length: float):
+        self.screen = screen
+        # Length of the world - positions wrap around it
+        self.ring_length = ring_length
+
+        # Task tile -> indicator, for task tiles that are not visible
+        self.indicators: Dict[Tile, Indicator] = {}
+        # Unused indicators, ready to be reused
+        self._pool: List[Indicator] = []
+
+        # Task tiles ring positions (sorted) and tiles in the same order
+        self._positions: List[float] = []
+        self._tiles: List[Tile] = []
+        # Task tile -> ring position
+        self._tile_positions: Dict[Tile, float] = {}
+
+    def add(self, tile: Tile, position: float) -> None:
+        """Add task tile at its ring position."""
+        position %= self.ring_length
+        idx = bisect_right(self._positions, position)
+        self._positions.insert(idx, position)
+        self._tiles.insert(idx, tile)
+        self._tile_positions[tile] = position
+
+    def remove(self, tile: Tile) -> None:
+        """Remove task tile and its indicator."""
+        position = self._tile_positions.pop(tile)
+        idx = bisect_left(self._positions, position)
+        # Tiles can share the same position - find the exact tile
+        while self._tiles[idx] is not tile:
+            idx += 1
+        del self._positions[idx]
+        del self._tiles[idx]
+
+        indicator = self.indicators.pop(tile, None)
+        if indicator is not None:
+            self._pool.append(indicator)
+
+    def sync(self, visible_tiles: Set[Tile], camera: float) -> None:
+        """Add, remove and flip indicators for camera position and visible tiles."""
+        for tile, is_left in self.__sides(camera):
+            indicator = self.indicators.get(tile)
+
+            # If tile is visible - dont need indicator
+            if tile in visible_tiles:
+                if indicator is not None:
+                    del self.indicators[tile]
+                    self._pool.append(indicator)
+                continue
+
+            if indicator is None:
+                self.indicators[tile] = self.__acquire(tile, is_left)
+            else:
+                indicator.flip(is_left)
+
+    def update(self) -> None:
+        """Calls update method of every indicator."""
+        for indicator in self.indicators.values():
+            indicator.update()
+
+    def draw(self) -> None:
+        """Draw indicators showing tasks positions."""
+        for indicator in self.indicators.values():
+            indicator.draw()
+
+    def __acquire(self, tile: Tile, is_left: bool) -> Indicator:
+        """Get indicator for tile - reuse one from the pool if possible."""
+        if self._pool:
+            indicator = self._pool.pop()
+            indicator.reset(tile, is_left)
+            return indicator
+        return Indicator(self.screen, tile, is_left)
+
+    def __sides(self, camera: float) -> Generator[Tuple[Tile, bool], None, None]:
+        """
+        Yields (tile, is to the left) for every task tile, in ring order from camera.
+
+        Tiles less than half of the ring to the right of camera are to the right.
+        """
+        count = len(self._tiles)
+        camera %= self.ring_length
+        opposite = (camera + self.ring_length / 2) % self.ring_length
+
+        start = bisect_left(self._positions, camera)
+        end = bisect_left(self._positions, opposite)
+        if camera <= opposite:
+            right_count = end - start
+        else:
+            right_count = count - start + end
+
+        for offset in range(count):
+            yield self._tiles[(start + offset) % count], offset >= right_count
@@ -0,0 +1,186 @@
+import logging
+import random
+import threading
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+Coords = Tuple[int, int]  # Y, X
+# Row-major grid of CellType values - cell (y, x) is at index y * width + x
+Grid = bytearray
+# (width, height, start, min solution length)
+MazeKey = Tuple[int, int, Coords, int]
+
+
+class CellType(IntEnum):
+    """Type of cell in maze map. Values fit in a byte, so grid can be a bytearray."""
+
+    UNVISITED = 1
+    VISITED = 2
+    WALL = 3
+    START = 4
+    END = 5
+
+
+def generate_maze(
+    width: int,
+    height: int,
+    start: Coords,
+    min_length: int = 0,
+    rng: Optional[random.Random] = None,
+    max_attempts: int = 1000,
+) -> Grid:
+    """
+    Generates a maze - grid of CellType. Width and height include the maze border.
+
+    Mazes are generated until the solution (start to end) is at least min_length long.
+    Raises ValueError if no such maze was generated in max_attempts.
+    """
+    rng = rng or random.Random()
+
+    for _ in range(max_attempts):
+        grid, end, length = _generate_maze(width, height, start, rng)
+        if length >= min_length:
+            # Mark starting and ending nodes
+            grid[start[0] * width + start[1]] = CellType.START
+            grid[end[0] * width + end[1]] = CellType.END
+            return grid
+
+    raise ValueError(
+        f"Could not generate {width}x{height} maze with solution of {min_length} cells"
+    )
+
+
+def _generate_maze(
+    width: int, height: int, start: Coords, rng: random.Random
+) -> Tuple[Grid, Coords, int]:
+    """
+    Generates a single maze. Returns grid, farthest cell from start and its distance.
+
+    Depth-first search algorithm is used, with explicit stack instead of recursion,
+      so maze size is not limited by the recursion limit.
+    Algorithm navigates through nodes
+      and marks then as visited or wall depending if it has visited neighbors.
+    Visited nodes form a tree, so the longest path from start is the maze solution.
+    """
+    # Template rows for the maze
+    wall_row = bytes([CellType.WALL] * width)
+    row = bytes([CellType.WALL] + [CellType.UNVISITED] * (width - 2) + [CellType.WALL])
+    # Initial grid for the maze
+    grid = bytearray(wall_row + row * (height - 2) + wall_row)
+
+    def visit(prev: Optional[Coords], new: Coords) -> Optional[List[Coords]]:
+        """
+        Visit new node coming from prev node.
+
+        Returns nodes to visit next in random order, or None if node can't be visited.
+        """
+        new_y, new_x = new
+        if grid[new_y * width + new_x] != CellType.UNVISITED:
+            return None
+
+        # Create a list of possible nodes to visit
+        directions = [
+            (y, x)
+            for y, x in [
+                (new_y, new_x - 1),
+                (new_y, new_x + 1),
+                (new_y - 1, new_x),
+                (new_y + 1, new_x),
+            ]
+            if 0 <= y < height and 0 <= x < width and (y, x) != prev
+        ]
+
+        # Check if any possible visit node was visited.
+        # We don't want to have 2 visited nodes together, unless it is where we came from.
+        if any(grid[y * width + x] == CellType.VISITED for y, x in directions):
+            grid[new_y * width + new_x] = CellType.WALL
+            return None
+
+        grid[new_y * width + new_x] = CellType.VISITED
+        rng.shuffle(directions)
+        return directions
+
+    # farthest point from starting point
+    farthest = (start, 0)
+    # Stack of (node, path length to node, nodes left to visit from node)
+    stack = [(start, 0, visit(None, start) or [])]
+    while stack:
+        node, n, directions = stack[-1]
+        if not directions:
+            stack.pop()
+            continue
+
+        direction = directions.pop()
+        next_directions = visit(node, direction)
+        if next_directions is not None:
+            # Check if it is the longest path
+            if n + 1 > farthest[1]:
+                farthest = (direction, n + 1)
+            stack.append((direction, n + 1, next_directions))
+
+    return grid, farthest[0], farthest[1]
+
+
+class MazePool:
+    """
+    Pool of pre-generated mazes for each maze size.
+
+    Mazes are generated in a background thread, so taking a maze from the pool is instant.
+    If the pool of the size is empty, maze is generated right away.
+    """
+
+    def __init__(self, size: int = 3):
+        # How many mazes to keep ready for each maze size
+        self.size = size
+
+        self._mazes: Dict[MazeKey, Deque[Grid]] = {}
+        self._lock = threading.Lock()
+        self._refilling = set()
+        # Separate random generator, so background thread does not change game randomness
+        self._rng = random.Random()
+
+    def prepare(
+        self, width: int, height: int, start: Coords, min_length: int = 0
+    ) -> None:
+        """Start filling the pool for maze size in the background."""
+        key = (width, height, start, min_length)
+        with self._lock:
+            if key in self._refilling or len(self._mazes.get(key, ())) >= self.size:
+                return
+            self._refilling.add(key)
+
+        threading.Thread(target=self.__refill, args=(key,), daemon=True).start()
+
+    def get(self, width: int, height: int, start: Coords, min_length: int = 0) -> Grid:
+        """Take a maze of the size from the pool, and refill the pool in the background."""
+        key = (width, height, start, min_length)
+        with self._lock:
+            mazes = self._mazes.get(key)
+            maze = mazes.popleft() if mazes else None
+
+        if maze is None:
+            logger.debug(f"Maze pool empty for {key} - generating maze right away")
+            maze = generate_maze(*key)
+
+        self.prepare(*key)
+        return maze
+
+    def __refill(self, key: MazeKey) -> None:
+        """Generate mazes until the pool for maze size is full."""
+        try:
+            while True:
+                with self._lock:
+                    if len(self._mazes.get(key, ())) >= self.size:
+                        return
+                maze = generate_maze(*key, rng=self._rng)
+                with self._lock:
+                    self._mazes.setdefault(key, deque()).append(maze)
+        except ValueError:
+            logger.exception(f"Maze pool can not be filled for {key}")
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
@@ -5,18 +5,23 @@ import time
 
 import pygame as pg
 
-from project.constants import Color, TILE_COLS, TILE_ROWS, WIDTH
+from project.constants import Color, WIDTH
+from project.utils.dirty_rects import DirtyRects
 from project.utils.helpers import realtime_to_ingame_formatted
+from project.utils.text_cache import TextCache
 from project.utils.user_data import UserData
 from .biome import BiomeCity, BiomeDesert, BiomeForest, BiomePlains
 from .earth import Earth
 from .game_state import GameState
 from .sun import Sun
 from .task import TaskCursorMaze, TaskRockPaperScissors, TaskTicTacToe
+from .task_registry import TaskRegistry
 
 
 logger = logging.getLogger(__name__)
+dirty_rects = DirtyRects()
 game_vars = GameState()
+text_cache = TextCache()
 user_data = UserData()
 
 
@@ -80,10 +85,11 @@ class Period(object):
         # Time passed after the last task spawn
         self.time_of_last_task_spawn = None
 
-        self.earth = Earth(self.screen, self.biomes)
-        self.sun = Sun(
-            self.screen, self.earth.biomes, self.heat_per_tick, self.heat_per_task
-        )
+        # Live tasks between all biomes
+        self.tasks = TaskRegistry()
+
+        self.earth = Earth(self.screen, self.biomes, self.tasks)
+        self.sun = Sun(self.screen, self.tasks, self.heat_per_tick, self.heat_per_task)
 
     @property
     def hiscore(self) -> float:
@@ -128,6 +134,7 @@ class Period(object):
     def draw(self) -> None:
         """Draw the sky, earth and survived date."""
         self.screen.fill(Color.sky)
+        dirty_rects.add_screen()
         self.earth.draw(self.sun)
         self.draw_age()
 
@@ -142,9 +149,8 @@ class Period(object):
             else:
                 self.pause_time = None
 
-            font = pg.font.Font(None, 50)
             text = realtime_to_ingame_formatted(self.elapsed, self.start_date)
-            age_indicator = font.render(text, True, pg.Color("black"))
+            age_indicator = text_cache.render(text, 50, Color.black)
             self.screen.blit(
                 age_indicator,
                 (int(WIDTH // 2) - int(age_indicator.get_width() // 2), 0),
@@ -152,9 +158,8 @@ class Period(object):
 
     def __handle_task_spawn(self) -> None:
         """Logic to check if task should be spawned and updates spawn frequency."""
-        task_count = sum(b.tilemap.task_count for b in self.biomes)
         # If we are not at the tasks limit and the timing is right
-        if task_count < self.task_max_count and (
+        if len(self.tasks) < self.task_max_count and (
             self.time_of_last_task_spawn is None
             or self.time_of_last_task_spawn >= self.task_spawn_freq
         ):
@@ -168,28 +173,23 @@ class Period(object):
         self.task_spawn_freq = max(self.task_spawn_freq, self.task_spawn_freq_max)
 
     def __spawn_task(self) -> None:
-        """Spawns a task on a random tile."""
-        # Get number of tiles between all biomes
-        tile_count = TILE_COLS * TILE_ROWS * len(self.biomes)
-        # Chose a random tile out of all
-        random_tile_idx = random.randint(0, tile_count - 1)
-        # Calculate biome index from the global tile index
-        biome_idx = random_tile_idx // (TILE_COLS * TILE_ROWS)
-        # Calculate tile index local to the biome chosen
-        tile_in_biome_idx = random_tile_idx - (TILE_COLS * TILE_ROWS * biome_idx)
-        tile_y = tile_in_biome_idx // TILE_COLS
-        tile_x = tile_in_biome_idx - (tile_y * TILE_COLS)
-
-        biome = self.biomes[biome_idx]
+        """Spawns a task on a random tile, that does not have a task yet."""
+        free_counts = [biome.tilemap.free_count for biome in self.biomes]
+        if sum(free_counts) == 0:
+            return
+
+        # Chose a random free tile out of all - biomes with more free tiles are more likely
+        biome = random.choices(self.biomes, weights=free_counts)[0]
+        tile_y, tile_x = biome.tilemap.random_free_coords()
+
         new_task = random.choices(
             [TaskCursorMaze, TaskRockPaperScissors, TaskTicTacToe],
             weights=[self.maze_chance, self.rps_chance, self.ttt_chance],
         )
-        biome.tilemap.set_task_by_coords(
-            tile_y, tile_x, new_task[0](self.screen, biome)
-        )
+        tile = biome.tilemap[tile_y][tile_x]
+        self.tasks.add(biome, tile, new_task[0](self.screen, biome))
 
-        self.earth.fix_indicators()
+        self.earth.task_added(biome, tile)
 
 
 class PeriodMedieval(Period):
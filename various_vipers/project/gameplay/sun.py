@@ -1,12 +1,12 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 import pygame as pg
 
 from project.constants import HEIGHT, MAX_HEAT, SUN_IMAGE, THERMO, THERMO_FILL, WIDTH
 from project.utils.helpers import load_img
-from .biome import Biome
 from .game_state import GameState
+from .task_registry import TaskRegistry
 
 
 logger = logging.getLogger(__name__)
@@ -20,16 +20,22 @@ class Sun:
     min_angle_vel: float = 0.5
     max_angle_vel: float = 4
 
+    # Degrees between cached rotations. Use larger step if sun image is symmetric.
+    rotation_step: int = 1
+
+    # Rotations cache shared between all suns - rotation step -> list of images
+    _rotation_cache: Dict[int, List[pg.Surface]] = {}
+
     def __init__(
         self,
         screen: pg.Surface,
-        biomes: List[Biome],
+        tasks: TaskRegistry,
         heat_per_tick: float,
         heat_per_task: float,
     ):
         self.screen = screen
 
-        self.biomes = biomes
+        self.tasks = tasks
         self.heat_per_tick = heat_per_tick
         self.heat_per_task = heat_per_task
 
@@ -42,11 +48,14 @@ class Sun:
         new_height = int(HEIGHT // 2)
         scale_percent = new_height / self.image.get_height()
         new_width = int(self.image.get_width() * scale_percent)
-        self.image = pg.transform.scale(self.image, (new_width, new_height))
+        self.image = load_img(SUN_IMAGE, size=(new_width, new_height))
         # Create cache of every image rotation, so we don't have to calculate each time
-        self._image_cache = []
-        for angle in range(361):
-            self._image_cache.append(pg.transform.rotate(self.image, angle))
+        if self.rotation_step not in self._rotation_cache:
+            self._rotation_cache[self.rotation_step] = [
+                self.__visible_rotation(angle)
+                for angle in range(0, 360, self.rotation_step)
+            ]
+        self._image_cache = self._rotation_cache[self.rotation_step]
 
     def update(self, event: pg.event) -> None:
         """Update sun angle, position and heat value."""
@@ -54,17 +63,14 @@ class Sun:
 
         if game_vars.is_started:
             # Increase heat based on uncompleted task count
-            task_count = sum(b.tilemap.task_count for b in self.biomes)
-
-            game_vars.current_heat += (
-                self.heat_per_tick + self.heat_per_task * task_count
-            )
+            heat = self.heat_per_tick + self.heat_per_task * len(self.tasks)
+            game_vars.current_heat += heat
             game_vars.current_heat = min(max(game_vars.current_heat, 0), MAX_HEAT)
 
     def draw(self) -> None:
         """~~Draw~~ Praise the sun."""
         self.screen.blit(
-            self._image_cache[int(self.angle)], self.image.get_rect(center=(0, 0))
+            self._image_cache[int(self.angle) // self.rotation_step], (0, 0)
         )
 
         # If game started - draw the thermometer, which gets filled based on heat value
@@ -79,6 +85,17 @@ class Sun:
                 fill_rect,
             )
 
+    def __visible_rotation(self, angle: int) -> pg.Surface:
+        """
+        Rotate sun image by angle.
+
+        Sun is centered at (0, 0) - keep only the bottom right quarter, which is on screen.
+        """
+        rotated = pg.transform.rotate(self.image, angle)
+        rect = rotated.get_rect(center=(0, 0))
+        visible = pg.Rect(-rect.x, -rect.y, rect.right, rect.bottom)
+        return rotated.subsurface(visible).copy()
+
     def update_angle(self) -> None:
         """Update suns angle relative to itself. Called every game tick."""
         # Calculate angular velocity based on current heat
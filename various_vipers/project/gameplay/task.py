@@ -1,12 +1,9 @@
 import logging
-from dataclasses import dataclass
-from enum import Enum
-from random import choice, randint, shuffle
+from random import choice, randint
 from time import time
-from typing import List, Optional, Tuple
+from typing import Generator, Optional, Tuple
 
 import pygame as pg
-from pygame.transform import scale
 
 from project.UI.fx.sound import Sound
 from project.constants import (
@@ -27,11 +24,16 @@ from project.constants import (
 )
 from project.utils.helpers import load_img
 from project.utils.notification import Notification
+from project.utils.text_cache import TextCache
 from .game_state import GameState
+from .maze import CellType, MazePool
+from .tictactoe import TicTacToe
 
 
 logger = logging.getLogger(__name__)
 game_vars = GameState()
+maze_pool = MazePool()
+text_cache = TextCache()
 
 
 class Task(object):
@@ -108,12 +110,11 @@ class Task(object):
 
     def _draw_timer(self) -> None:
         """Draw time left for this task before it closes."""
-        font = pg.font.Font(None, 70)
-        time_left = self._time_left
-        timer = font.render(f"{time_left:.2f}s", True, pg.Color("red"))
-        timer_x = self.window_rect.x + self.window_rect.width - timer.get_width()
+        timer = f"{self._time_left:.2f}s"
+        atlas = text_cache.atlas(70, Color.red)
+        timer_x = self.window_rect.x + self.window_rect.width - atlas.size(timer)[0]
         timer_y = self.window_rect.y - 45
-        self.screen.blit(timer, (timer_x, timer_y))
+        atlas.draw(self.screen, timer, (timer_x, timer_y))
 
 
 class TaskCursorMaze(Task):
@@ -135,13 +136,20 @@ class TaskCursorMaze(Task):
     # width and height include the border of the maze
     maze_width: int = 15
     maze_height: int = 11
+    # Min length of path from start to end
+    maze_min_solution: int = 40
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.maze = []
+        # Grid of maze cell types, see maze.py
+        self.maze = bytearray()
         # If the player has started the maze - moved mouse over start
         self.started = False
+        # Mouse position on last update - maze collisions are checked between positions
+        self.last_mouse_pos = (0, 0)
+        # Is maze started -> (image, position) to draw
+        self.maze_images = {}
 
         self.cell_size = (
             self.window_rect.width // self.maze_width,
@@ -149,24 +157,27 @@ class TaskCursorMaze(Task):
         )
 
         # Prepare images for the maze
-        self.start_image = scale(
-            load_img(self.biome.image_from(MAZE_START), False), self.cell_size
+        self.start_image = load_img(
+            self.biome.image_from(MAZE_START), False, self.cell_size
         )
 
-        self.end_image = scale(
-            load_img(self.biome.image_from(MAZE_END), False), self.cell_size
+        self.end_image = load_img(
+            self.biome.image_from(MAZE_END), False, self.cell_size
         )
 
-        self.path_image = scale(
-            load_img(self.biome.image_from(MAZE_PATH), False), self.cell_size
+        self.path_image = load_img(
+            self.biome.image_from(MAZE_PATH), False, self.cell_size
         )
 
-        self.wall_image = scale(
-            load_img(self.biome.image_from(MAZE_WALL), False), self.cell_size
+        self.wall_image = load_img(
+            self.biome.image_from(MAZE_WALL), False, self.cell_size
         )
 
+        # Generate maze in the background, before the player clicks on the task
+        maze_pool.prepare(*self.__maze_params())
+
     def start(self) -> None:
-        """Generate the maze when user clicks on task."""
+        """Take a maze from the pool when user clicks on task."""
         super().start()
         self.__generate_maze()
 
@@ -174,140 +185,118 @@ class TaskCursorMaze(Task):
         """Check mouse collisions if player is in maze."""
         super().update()
 
-        for cell in self.maze:
-            mouse_hover = cell.rect.collidepoint(pg.mouse.get_pos())
-            if (
-                not self.started
-                and cell.cell_type == self.CellType.START
-                and mouse_hover
-            ):
+        # Check every cell mouse went over since the last update,
+        #   so fast mouse movements can't skip walls
+        mouse_pos = pg.mouse.get_pos()
+        for cell_type in self.__swept_cells(self.last_mouse_pos, mouse_pos):
+            if not self.started and cell_type == CellType.START:
                 self.started = True
-            elif self.started and mouse_hover:
-                if cell.cell_type == self.CellType.END:
-                    self._complete(True)
-                elif cell.cell_type == self.CellType.WALL:
-                    self._complete(False)
+            elif self.started and cell_type == CellType.END:
+                self._complete(True)
+                break
+            elif self.started and cell_type == CellType.WALL:
+                self._complete(False)
+                break
+        self.last_mouse_pos = mouse_pos
 
     def draw(self) -> None:
         """Draw the maze."""
         super().draw()
 
-        for cell in self.maze:
-            # Only draw the starting cell if player has not started the maze
-            if self.started or cell.cell_type == self.CellType.START:
-                self.screen.blit(cell.image, cell.rect.topleft)
+        # Only the starting cell is drawn if player has not started the maze
+        self.screen.blit(*self.maze_images[self.started])
 
     def __generate_maze(self) -> None:
         """
-        Generates a maze for this task.
+        Takes a pre-generated maze for this task from the maze pool.
 
-        Depth-first search algorithm is used.
-        Algorithm recursively navigates through nodes
-          and marks then as visited or wall depending if it has visited neighbors.
-        We are keeping track of longest path from start that will be set as maze solution.
+        Maze is generated with depth-first search, see maze.generate_maze.
+        Solution path from start to end is at least maze_min_solution cells long.
         """
-        # farthest point from starting point
-        farthest = (0, None)
-        # Template row for the maze
-        row = (
-            [self.CellType.WALL]
-            + ([self.CellType.UNVISITED] * (self.maze_width - 2))
-            + [self.CellType.WALL]
-        )
-        # Initial 2D array for the maze
-        cells = (
-            [[self.CellType.WALL] * (self.maze_width)]
-            + [row[:] for _ in range(self.maze_height - 2)]
-            + [[self.CellType.WALL] * (self.maze_width)]
+        self.maze = maze_pool.get(*self.__maze_params())
+        self.last_mouse_pos = pg.mouse.get_pos()
+        self.__render_maze()
+
+    def __maze_params(self) -> Tuple[int, int, Tuple[int, int], int]:
+        """Returns maze (width, height, start, min solution length) for the maze pool."""
+        return (
+            self.maze_width,
+            self.maze_height,
+            self.maze_start,
+            self.maze_min_solution,
         )
 
-        def deeper(
-            prev_y: int, prev_x: int, new_y: int, new_x: int, n: int = 0
-        ) -> None:
-            """
-            Recursively navigate through maze map.
-
-            prev_y, prev_x -> where we came from
-            new_y, new_x -> position to investigate now
-            n -> current path length
-            """
-            if cells[new_y][new_x] != self.CellType.UNVISITED:
+    def __render_maze(self) -> None:
+        """Draw the whole maze onto a single image, once - maze does not change."""
+        images = {
+            CellType.UNVISITED: self.path_image,
+            CellType.VISITED: self.path_image,
+            CellType.WALL: self.wall_image,
+            CellType.START: self.start_image,
+            CellType.END: self.end_image,
+        }
+        cell_w, cell_h = self.cell_size
+
+        maze_image = pg.Surface((self.maze_width * cell_w, self.maze_height * cell_h))
+        for i, cell_type in enumerate(self.maze):
+            y, x = divmod(i, self.maze_width)
+            maze_image.blit(images[cell_type], (x * cell_w, y * cell_h))
+
+        start_y, start_x = self.maze_start
+        self.maze_images = {
+            True: (maze_image, self.window_rect.topleft),
+            # Before the maze is started - only the starting cell
+            False: (
+                self.start_image,
+                (
+                    self.window_rect.x + start_x * cell_w,
+                    self.window_rect.y + start_y * cell_h,
+                ),
+            ),
+        }
+
+    def __swept_cells(
+        self, start: Tuple[int, int], end: Tuple[int, int]
+    ) -> Generator[CellType, None, None]:
+        """
+        Yields types of maze cells crossed by line from start to end (screen positions).
+
+        Cells are found by walking the grid from the start cell to the end cell,
+          one cell border at a time (in order they are crossed).
+        Positions outside of the maze are skipped.
+        """
+        cell_w, cell_h = self.cell_size
+        x0, y0 = start[0] - self.window_rect.x, start[1] - self.window_rect.y
+        x1, y1 = end[0] - self.window_rect.x, end[1] - self.window_rect.y
+        x, y = x0 // cell_w, y0 // cell_h
+        end_x, end_y = x1 // cell_w, y1 // cell_h
+
+        dx, dy = abs(x1 - x0), abs(y1 - y0)
+        step_x, step_y = (1 if x1 > x0 else -1), (1 if y1 > y0 else -1)
+        # Distance to the next vertical/horizontal cell border crossed by the line.
+        # Borders are crossed at part of the line (0 - 1) border_x / dx and border_y / dy,
+        #   compared with multiplication, so crossings through cell corners are exact.
+        border_x = (x + 1) * cell_w - x0 if step_x > 0 else x0 - x * cell_w
+        border_y = (y + 1) * cell_h - y0 if step_y > 0 else y0 - y * cell_h
+
+        while True:
+            if 0 <= x < self.maze_width and 0 <= y < self.maze_height:
+                yield self.maze[y * self.maze_width + x]
+            if x == end_x and y == end_y:
                 return
 
-            # Create a list of possible nodes to visit
-            directions = []
-            if new_x > 0 and (new_y, new_x - 1) != (prev_y, prev_x):
-                directions.append((new_y, new_x - 1))
-            if new_x < self.maze_width - 1 and (new_y, new_x + 1) != (prev_y, prev_x):
-                directions.append((new_y, new_x + 1))
-            if new_y > 0 and (new_y - 1, new_x) != (prev_y, prev_x):
-                directions.append((new_y - 1, new_x))
-            if new_y < self.maze_height - 1 and (new_y + 1, new_x) != (prev_y, prev_x):
-                directions.append((new_y + 1, new_x))
-
-            # Check if any possible visit node was visited.
-            # We don't want to have 2 visited nodes together, unless it is where we came from.
-            for direction in directions:
-                if cells[direction[0]][direction[1]] == self.CellType.VISITED:
-                    cells[new_y][new_x] = self.CellType.WALL
-                    return
-
-            cells[new_y][new_x] = self.CellType.VISITED
-
-            # Increment current path length; check if it is the longest path.
-            n += 1
-            nonlocal farthest
-            if n > farthest[0]:
-                farthest = (n, (new_y, new_x))
-
-            # Try all the possible nodes
-            while len(directions) > 0:
-                direction = choice(directions)
-                if direction:
-                    deeper(new_y, new_x, *direction, n)
-                    directions.remove(direction)
-
-        # Start generating the maze
-        deeper(None, None, *self.maze_start)
-        # Mark starting and ending nodes
-        cells[self.maze_start[0]][self.maze_start[1]] = self.CellType.START
-        cells[farthest[1][0]][farthest[1][1]] = self.CellType.END
-
-        self.maze = []
-        y = self.window_rect.y
-        # Convert 2D array of CellType to 1D array of Cell
-        for row in cells:
-            x = self.window_rect.x
-            for cell in row:
-                rect = pg.Rect(x, y, *self.cell_size)
-                image = self.path_image
-                if cell == self.CellType.WALL:
-                    image = self.wall_image
-                elif cell == self.CellType.START:
-                    image = self.start_image
-                elif cell == self.CellType.END:
-                    image = self.end_image
-                self.maze.append(self.Cell(rect, image, cell))
-
-                x += self.cell_size[0]
-            y += self.cell_size[1]
-
-    @dataclass
-    class Cell:
-        """Maze cell object class."""
-
-        rect: pg.Rect
-        image: pg.Surface
-        cell_type: "CellType"  # noqa
-
-    class CellType(Enum):
-        """Type of cell in maze map."""
-
-        UNVISITED = 1
-        VISITED = 2
-        WALL = 3
-        START = 4
-        END = 5
+            crossing = border_x * dy - border_y * dx
+            if x != end_x and y != end_y and crossing == 0:
+                # Line goes through the cell corner - both cells next to it are touched
+                for side_x, side_y in [(x + step_x, y), (x, y + step_y)]:
+                    if 0 <= side_x < self.maze_width and 0 <= side_y < self.maze_height:
+                        yield self.maze[side_y * self.maze_width + side_x]
+                x, border_x = x + step_x, border_x + cell_w
+                y, border_y = y + step_y, border_y + cell_h
+            elif y == end_y or (x != end_x and crossing < 0):
+                x, border_x = x + step_x, border_x + cell_w
+            else:
+                y, border_y = y + step_y, border_y + cell_h
 
 
 class TaskRockPaperScissors(Task):
@@ -383,22 +372,23 @@ class TaskRockPaperScissors(Task):
             # load it from current biome and
             # scale it for human choice
             self.choice_images.append(
-                scale(load_img(self.biome.image_from(img)), [self.choice_rect_side] * 2)
+                load_img(self.biome.image_from(img), size=(self.choice_rect_side,) * 2)
             )
             # load it from current biome and
             # scale it for computer choice
             self.computer_images.append(
-                scale(
-                    load_img(self.biome.image_from(img)), [self.computer_rect_side] * 2
+                load_img(
+                    self.biome.image_from(img), size=(self.computer_rect_side,) * 2
                 )
             )
         # one more extra image for the computer
         # it is a question mark and displays it
         # till the human makes a choice
         self.computer_images.append(
-            scale(
-                load_img(self.biome.image_from(QUESTION_MARK), False),
-                [self.computer_rect_side] * 2,
+            load_img(
+                self.biome.image_from(QUESTION_MARK),
+                False,
+                (self.computer_rect_side,) * 2,
             )
         )
 
@@ -492,9 +482,12 @@ class TaskTicTacToe(Task):
         self.game_over = False
 
         # human, computer and board representation
+        # board is kept as bitboards - bit i is set if player has a mark in cell i
         self.human = -1
         self.computer = +1
-        self.board = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+        self.engine = TicTacToe.get(3, 3)
+        self.human_bits = 0
+        self.computer_bits = 0
 
         # which is going to move first and the side of the board rect
         self.first_move = int()
@@ -529,34 +522,23 @@ class TaskTicTacToe(Task):
         # get background and hover color from the biome context
         self.bg_color, self.bg_color_hover = self.biome.color
 
-        # create map indexed
-        # so we can use int to access the board cell
-
-        # 0 - [0, 0], 1 - [0, 1], 2 - [0, 2]
-        # 3 - [0, 0], 4 - [0, 1], 5 - [0, 2]
-        # 6 - [0, 0], 7 - [0, 1], 8 - [0, 2]
-
-        self.map_indexes = dict(
-            zip(range(0, 9), [(i, j) for i in range(3) for j in range(3)])
-        )
-
         # load the image of the X and O
         # X is always the human
         # O is always the computer
 
-        self.x_image = scale(
-            load_img(self.biome.image_from(X), False), [self.cell_side] * 2
-        )
+        self.x_image = load_img(self.biome.image_from(X), False, (self.cell_side,) * 2)
 
-        self.o_image = scale(
-            load_img(self.biome.image_from(O), False), [self.cell_side] * 2
-        )
+        self.o_image = load_img(self.biome.image_from(O), False, (self.cell_side,) * 2)
 
         # load the square grid image
-        self.grid = scale(
-            load_img(self.biome.image_from(TTT_GRID)),
-            [self.board_rect.width, self.board_rect.height],
-        )
+        self.grid = load_img(self.biome.image_from(TTT_GRID), size=self.board_rect.size)
+
+        # board with background, grid and all placed marks - updated when a move is placed
+        self.board_image = pg.Surface(self.board_rect.size)
+        self.board_image.fill(self.bg_color)
+        self.board_image.blit(self.grid, (0, 0))
+        # hover images of cells (hover color with grid on top) - cell index -> image
+        self.hover_images = {}
 
     def start(self) -> None:
         """
@@ -577,36 +559,28 @@ class TaskTicTacToe(Task):
         """Handle events, user, input and makes computer moves."""
         super().update()
 
-        # iterate all cells and check for events
-        for i, cell in enumerate(self.cells):
-            # click and hover - this means that the cell is clicked
-            mouse_hover = cell.collidepoint(pg.mouse.get_pos())
-            mouse_click = event.type == pg.MOUSEBUTTONDOWN
-
-            x, y = self.map_indexes[i]  # take indexes from int
-            empty_cell = self.board[x][y] == 0  # bool if the cell is empty
-
-            if (
-                mouse_click
-                and mouse_hover
-                and empty_cell
-                and self.turn == self.human  # ensure that is a human turn
-                and (time() - self.last_click) > 0.3  # prevent clicking too much
-                and (time() - self.delay) > 0.3  # prevent clicking after task click
-            ):
-                # plays the clicking sound and saves last click
-                Sound.click.play()
-                self.last_click = time()
-
-                # inserts human move into the board and gives turn to the computer
-                self.__insert_human_move(i)
-                # reverses the turn
-                # 1 * -1 = -1
-                # -1 * -1 = 1
-                self.turn *= -1
+        # click on an empty cell under the mouse
+        i = self.__empty_cell_at(pg.mouse.get_pos())
+        if (
+            event.type == pg.MOUSEBUTTONDOWN
+            and i is not None
+            and self.turn == self.human  # ensure that is a human turn
+            and (time() - self.last_click) > 0.3  # prevent clicking too much
+            and (time() - self.delay) > 0.3  # prevent clicking after task click
+        ):
+            # plays the clicking sound and saves last click
+            Sound.click.play()
+            self.last_click = time()
+
+            # inserts human move into the board and gives turn to the computer
+            self.__insert_human_move(i)
+            # reverses the turn
+            # 1 * -1 = -1
+            # -1 * -1 = 1
+            self.turn *= -1
 
         if not self.game_over and (
-            self.__won(self.board, self.human) or len(self.__cells_left()) == 0
+            self.engine.won(self.human_bits) or self.engine.is_full(self.__taken())
         ):
             # it is a win if the human player or there are no cells left to be filled
 
@@ -622,7 +596,7 @@ class TaskTicTacToe(Task):
             self.__make_computer_move()
             self.turn *= -1
 
-        if not self.game_over and self.__won(self.board, self.computer):
+        if not self.game_over and self.engine.won(self.computer_bits):
             # if the computer won
             # set the same variables like in human win
             # the only difference is self.win
@@ -645,114 +619,62 @@ class TaskTicTacToe(Task):
         """Draw all elements and hover states."""
         super().draw()
 
-        # fill the background of the board with color
-        self.screen.fill(self.bg_color, self.board_rect)
-
-        # iterate every cell
-        for i, cell in enumerate(self.cells):
-            x, y = self.map_indexes[i]
-            # x, y are the indexes of the cell in matrix format
-
-            if cell.collidepoint(pg.mouse.get_pos()) and self.board[x][y] == 0:
-                # if the cell is hovered - fill it with different color
-                self.screen.fill(self.bg_color_hover, cell)
-
-            # draw the X and O images for the human and computer
-            if self.board[x][y] == self.human:
-                self.screen.blit(self.x_image, cell)
-            elif self.board[x][y] == self.computer:
-                self.screen.blit(self.o_image, cell)
-
-        # draw the grid of
-        self.screen.blit(self.grid, self.board_rect)
-
-    def __won(self, board: List[List[int]], player: int) -> bool:
-        """Checks  if given player is in winning positon."""
-        # the winning positions in the Tic Tac Toe are 8
-        # three horizontals
-        # three verticals
-        # two diagonals
-        win_boards = [
-            [board[0][0], board[0][1], board[0][2]],  # horizontal, 1 - row
-            [board[1][0], board[1][1], board[1][2]],  # horizontal, 2 - row
-            [board[2][0], board[2][1], board[2][2]],  # horizontal, 3 - row
-            [board[0][0], board[1][0], board[2][0]],  # vertical, 1 - column
-            [board[0][1], board[1][1], board[2][1]],  # vertical, 2 - column
-            [board[0][2], board[1][2], board[2][2]],  # vertical, 3 - column
-            [
-                board[0][0],
-                board[1][1],
-                board[2][2],
-            ],  # diagonal, top-left <> bottom-right
-            [
-                board[2][0],
-                board[1][1],
-                board[0][2],
-            ],  # diagonal, top-right <> bottom-left
-        ]
-
-        # check if the player is anywere in the winning positions
-        if 3 * [player] in win_boards:
-            return True
-        return False
-
-    def __cells_left(self) -> List[List[int]]:
-        """Returns a list of cordinates of empty cells."""
-        # store the empty cells in a list
-        cells = list()
-
-        # enumerate all the rows and each cell in it
-        for x, row in enumerate(self.board):
-            for y, cell in enumerate(row):
-                if cell == 0:
-                    # the cell is empty - add its cordinates to the list
-                    cells.append([x, y])
-        return cells
+        # board with all the placed X and O images
+        self.screen.blit(self.board_image, self.board_rect)
+
+        # if an empty cell is hovered - draw it with different color
+        i = self.__empty_cell_at(pg.mouse.get_pos())
+        if i is not None:
+            self.screen.blit(self.__hover_image(i), self.cells[i])
+
+    def __taken(self) -> int:
+        """Returns bitboard of all cells that are not empty."""
+        return self.human_bits | self.computer_bits
+
+    def __empty_cell_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Returns index of the empty cell at screen position, or None."""
+        x = (pos[0] - self.board_rect.left) // self.cell_side
+        y = (pos[1] - self.board_rect.top) // self.cell_side
+        if 0 <= x < 3 and 0 <= y < 3:
+            i = y * 3 + x
+            if not self.__taken() >> i & 1:
+                return i
+        return None
+
+    def __board_cell_rect(self, cell: int) -> pg.Rect:
+        """Returns rect of the cell, relative to the board."""
+        return self.cells[cell].move(-self.board_rect.left, -self.board_rect.top)
+
+    def __hover_image(self, cell: int) -> pg.Surface:
+        """Returns hovered cell image - hover color with the grid on top."""
+        image = self.hover_images.get(cell)
+        if image is None:
+            image = pg.Surface(self.cells[cell].size)
+            image.fill(self.bg_color_hover)
+            image.blit(self.grid, (0, 0), self.__board_cell_rect(cell))
+            self.hover_images[cell] = image
+        return image
+
+    def __draw_move(self, cell: int, image: pg.Surface) -> None:
+        """Draw X or O image of a placed move onto the board image."""
+        rect = self.__board_cell_rect(cell)
+        self.board_image.blit(image, rect)
+        # grid is drawn over the marks
+        self.board_image.blit(self.grid, rect, rect)
 
     def __insert_human_move(self, cell: int) -> None:
         """Inserts human move in the board."""
-        # take the x, y matrix indexes and insert the human symbol in the cell
-        x, y = self.map_indexes[cell]
-        self.board[x][y] = self.human
+        self.human_bits |= 1 << cell
+        self.__draw_move(cell, self.x_image)
 
     def __make_computer_move(self) -> None:
-        """The main algorithm for making a computer move."""
-        # win in the next move
-        for cell in self.__cells_left():
-            x, y = cell
-            self.board[x][y] = self.computer
-            if self.__won(self.board, self.computer):
-                self.board[x][y] = self.computer
-                return
-            else:
-                self.board[x][y] = 0
-
-        # block human win
-        for cell in self.__cells_left():
-            x, y = cell
-            self.board[x][y] = self.human
-            if self.__won(self.board, self.human):
-                self.board[x][y] = self.computer
-                return
-            else:
-                self.board[x][y] = 0
-
-        corners = [(0, 0), (0, 2), (2, 0), (2, 2)]
-
-        # take corners
-        shuffle(corners)
-        for cor in corners:
-            x, y = cor
-            if self.board[x][y] == 0:
-                self.board[x][y] = self.computer
-                return
-
-        # take center
-        if self.board[1][1] == 0:
-            self.board[1][1] = self.computer
-            return
+        """
+        Makes a computer move.
 
-        # take random cell
-        if len(self.__cells_left()) > 0:
-            x, y = choice(self.__cells_left())
-            self.board[x][y] = self.computer
+        Moves are looked up in the perfect-play table of the engine.
+        If there are several best moves, a random one is picked.
+        """
+        move = self.engine.best_move(self.computer_bits, self.human_bits)
+        if move is not None:
+            self.computer_bits |= 1 << move
+            self.__draw_move(move, self.o_image)
@@ -0,0 +1,66 @@
+import logging
+from typing import Dict, Iterator, Tuple
+
+from .biome import Biome
+from .task import Task
+from .tile import Tile
+
+
+logger = logging.getLogger(__name__)
+
+
+class TaskRegistry:
+    """
+    Keeps track of live (spawned and not completed) tasks between all biomes.
+
+    Tasks should be added and removed only through the registry,
+      so task counts never have to be recalculated.
+    """
+
+    def __init__(self):
+        # Task -> (biome, tile) of the task, in order tasks were spawned
+        self._tasks: Dict[Task, Tuple[Biome, Tile]] = {}
+        # Biome -> count of live tasks in biome
+        self._biome_counts: Dict[Biome, int] = {}
+
+    def add(self, biome: Biome, tile: Tile, task: Task) -> None:
+        """Add task to the tile in the biome."""
+        biome.tilemap.set_task_by_tile(tile, task)
+
+        self._tasks[task] = (biome, tile)
+        self._biome_counts[biome] = self._biome_counts.get(biome, 0) + 1
+
+    def remove(self, task: Task) -> None:
+        """Remove task from its tile."""
+        biome, tile = self._tasks.pop(task)
+        biome.tilemap.del_task_by_tile(tile)
+
+        self._biome_counts[biome] -= 1
+        if self._biome_counts[biome] == 0:
+            del self._biome_counts[biome]
+
+    def count_in(self, biome: Biome) -> int:
+        """Get count of live tasks in the biome."""
+        return self._biome_counts.get(biome, 0)
+
+    @property
+    def by_biome(self) -> Dict[Biome, int]:
+        """Get count of live tasks in each biome that has tasks."""
+        return dict(self._biome_counts)
+
+    def items(self) -> Iterator[Tuple[Task, Biome, Tile]]:
+        """Iterate through (task, biome, tile) of live tasks in spawn order."""
+        for task, (biome, tile) in self._tasks.items():
+            yield task, biome, tile
+
+    def __contains__(self, task: Task) -> bool:
+        """Check if task is live."""
+        return task in self._tasks
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate through live tasks in spawn order."""
+        return iter(self._tasks)
+
+    def __len__(self) -> int:
+        """Get count of live tasks."""
+        return len(self._tasks)
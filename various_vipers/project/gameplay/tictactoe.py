@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import logging
+import random
+from typing import Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Board of one player - bit i is set if player has a mark in cell i (row-major)
+Bits = int
+
+
+class TicTacToe:
+    """
+    Tic tac toe rules and computer player for size x size board with k marks in a row.
+
+    Each player's marks are kept as a bitboard, and lines are checked with win masks.
+    3x3 board is solved once into a perfect-play table (every reachable position),
+      bigger boards are searched with depth limited alpha-beta and a transposition table.
+    Engines are shared - use TicTacToe.get to get one.
+    """
+
+    # How many moves ahead to search on boards that are not solved into a table
+    search_depth: int = 4
+    # Transposition table is cleared when it grows over this size
+    transpositions_max: int = 200000
+
+    # All engines created so far - (size, k) -> engine
+    _engines: Dict[Tuple[int, int], TicTacToe] = {}
+
+    def __init__(self, size: int = 3, k: int = 3):
+        self.size = size
+        self.k = k
+        self.cells = size * size
+        self.full: Bits = (1 << self.cells) - 1
+        self.win_masks = self.__win_masks()
+
+        # Cells ordered from the center out - better moves are searched first
+        center = (size - 1) / 2
+        self.move_order = sorted(
+            range(self.cells),
+            key=lambda i: abs(i // size - center) + abs(i % size - center),
+        )
+
+        # Player bits -> is winning; only for small boards
+        self._won_table: Optional[bytearray] = None
+        if self.cells <= 9:
+            self._won_table = bytearray(
+                self.__is_won(bits) for bits in range(1 << self.cells)
+            )
+
+        # (mover bits, opponent bits) -> (score, best moves) of every reachable position
+        self._solved: Dict[Tuple[Bits, Bits], Tuple[int, Tuple[int, ...]]] = {}
+        # Transposition table - (mover bits, opponent bits) -> (depth, flag, score, move)
+        self._transpositions: Dict[Tuple[Bits, Bits], Tuple[int, int, float, int]] = {}
+
+        if self.cells <= 9:
+            # Any player can start - positions after first move of both are included
+            self.__solve(0, 0)
+            logger.debug(
+                f"Solved {size}x{size} tic tac toe: {len(self._solved)} positions"
+            )
+
+    @classmethod
+    def get(cls, size: int = 3, k: int = 3) -> TicTacToe:
+        """Get engine for board size and marks in a row; create it if it does not exist yet."""
+        engine = cls._engines.get((size, k))
+        if engine is None:
+            engine = cls._engines[(size, k)] = cls(size, k)
+        return engine
+
+    def won(self, bits: Bits) -> bool:
+        """Check if player with given marks has k marks in a row."""
+        if self._won_table is not None:
+            return bool(self._won_table[bits])
+        return self.__is_won(bits)
+
+    def is_full(self, taken: Bits) -> bool:
+        """Check if there are no empty cells left."""
+        return taken == self.full
+
+    def empty_cells(self, taken: Bits) -> List[int]:
+        """Returns empty cells, from the center out."""
+        return [i for i in self.move_order if not taken >> i & 1]
+
+    def best_move(
+        self, mover: Bits, opponent: Bits, rng: random.Random = random
+    ) -> Optional[int]:
+        """
+        Returns best cell for the player to move, or None if the game is over.
+
+        When there are several best moves on a solved board, rng picks one of them,
+          so moves are deterministic under a seed.
+        """
+        if self.won(mover) or self.won(opponent) or self.is_full(mover | opponent):
+            return None
+
+        solved = self._solved.get((mover, opponent))
+        if solved is not None:
+            return rng.choice(solved[1])
+
+        if len(self._transpositions) > self.transpositions_max:
+            self._transpositions.clear()
+        move = self.__alpha_beta(mover, opponent, self.search_depth, -2, 2)[1]
+        if move is None:
+            move = self.empty_cells(mover | opponent)[0]
+        return move
+
+    def __win_masks(self) -> List[Bits]:
+        """Returns masks of every k in a row line - rows, columns and both diagonals."""
+        masks = []
+        for y in range(self.size):
+            for x in range(self.size):
+                for dy, dx in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                    end_y, end_x = y + dy * (self.k - 1), x + dx * (self.k - 1)
+                    if 0 <= end_y < self.size and 0 <= end_x < self.size:
+                        mask = 0
+                        for i in range(self.k):
+                            mask |= 1 << ((y + dy * i) * self.size + x + dx * i)
+                        masks.append(mask)
+        return masks
+
+    def __is_won(self, bits: Bits) -> bool:
+        """Check all win masks against player marks."""
+        return any(bits & mask == mask for mask in self.win_masks)
+
+    def __solve(self, mover: Bits, opponent: Bits) -> int:
+        """
+        Solve position with negamax, saving score and best moves of every position.
+
+        Score is positive for win of the player to move, quicker wins score higher.
+        """
+        key = (mover, opponent)
+        solved = self._solved.get(key)
+        if solved is not None:
+            return solved[0]
+
+        taken = mover | opponent
+        empty = self.cells - bin(taken).count("1")
+        if self.won(opponent):
+            score, moves = -(empty + 1), ()
+        elif empty == 0:
+            score, moves = 0, ()
+        else:
+            score, best = -self.cells - 1, []
+            for move in self.empty_cells(taken):
+                move_score = -self.__solve(opponent, mover | 1 << move)
+                if move_score > score:
+                    score, best = move_score, [move]
+                elif move_score == score:
+                    best.append(move)
+            moves = tuple(sorted(best))
+
+        self._solved[key] = (score, moves)
+        return score
+
+    def __alpha_beta(
+        self, mover: Bits, opponent: Bits, depth: int, alpha: float, beta: float
+    ) -> Tuple[float, Optional[int]]:
+        """
+        Negamax search with alpha-beta pruning and transposition table.
+
+        Returns (score, best move). Scores are in range -1 (loss) to 1 (win),
+          positions at depth limit are scored by open lines.
+        """
+        if self.won(opponent):
+            return -1, None
+        taken = mover | opponent
+        if taken == self.full:
+            return 0, None
+        if depth == 0:
+            return self.__evaluate(mover, opponent), None
+
+        alpha_start = alpha
+        key = (mover, opponent)
+        tt_move = None
+        entry = self._transpositions.get(key)
+        if entry is not None:
+            tt_depth, flag, tt_score, tt_move = entry
+            if tt_depth >= depth:
+                if flag == 0:
+                    return tt_score, tt_move
+                if flag < 0:
+                    beta = min(beta, tt_score)
+                else:
+                    alpha = max(alpha, tt_score)
+                if alpha >= beta:
+                    return tt_score, tt_move
+
+        moves = self.empty_cells(taken)
+        # Best move of previous search is tried first
+        if tt_move is not None:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best_score, best_move = -2, moves[0]
+        for move in moves:
+            score = -self.__alpha_beta(
+                opponent, mover | 1 << move, depth - 1, -beta, -alpha
+            )[0]
+            # Prefer quicker wins and slower losses
+            score *= 0.99
+            if score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        # Flag: 1 - lower bound, -1 - upper bound, 0 - exact score
+        if best_score <= alpha_start:
+            flag = -1
+        elif best_score >= beta:
+            flag = 1
+        else:
+            flag = 0
+        self._transpositions[key] = (depth, flag, best_score, best_move)
+        return best_score, best_move
+
+    def __evaluate(self, mover: Bits, opponent: Bits) -> float:
+        """Score position by lines that can still be won by each player (-1 to 1)."""
+        score = 0
+        for mask in self.win_masks:
+            mine, theirs = mover & mask, opponent & mask
+            if mine and not theirs:
+                score += bin(mine).count("1") ** 2
+            elif theirs and not mine:
+                score -= bin(theirs).count("1") ** 2
+        return score / (len(self.win_masks) * self.k**2)
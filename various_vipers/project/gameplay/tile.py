@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Dict, Optional, TYPE_CHECKING, Tuple
 
 import pygame as pg
 
@@ -8,101 +9,209 @@ from project.constants import TILE_WIDTH
 from project.utils.helpers import load_img
 from .game_state import GameState
 
+if TYPE_CHECKING:
+    from .biome import Biome
+    from .task import Task
+
 
 logger = logging.getLogger(__name__)
 game_vars = GameState()
 
 
+class TileSprite:
+    """
+    Images shared by every tile of the same type (flyweight).
+
+    Holds the base image, the "breathing" animation frames and their tinted variants.
+    Animation frames are only built when a task lands on a tile of this type.
+    """
+
+    # Colors multiplied with the image to tint it
+    task_tint: Tuple[int, int, int] = (255, 0, 0)
+    hover_tint: Tuple[int, int, int] = (0, 0, 255)
+
+    # Storing scale as x multiplier to be able to use dict key
+    scale_n_max: int = 20  # How many times we can scale up
+    breathing_speed: float = 0.025  # how much to scale on each game tick
+
+    # All sprites created so far - one per image path
+    _sprites: Dict[str, TileSprite] = {}
+
+    def __init__(self, path: str):
+        self.path = path
+
+        # scale image based on game screen size
+        self.base_image = load_img(path, size=(TILE_WIDTH, None))
+
+        self._frames: Dict[int, pg.Surface] = {}
+        self._frames[1] = self.__scaled_frame(1)  # Default frame of idle tile
+
+        # Tinted frames - (scale_n, has task, is hovering) -> image
+        self._variants: Dict[Tuple[int, bool, bool], pg.Surface] = {}
+        # Masks of frames for precise mouse collision
+        self._masks: Dict[int, pg.mask.Mask] = {}
+
+    @classmethod
+    def get(cls, path: str) -> TileSprite:
+        """Get sprite for the image path; create it if it does not exist yet."""
+        sprite = cls._sprites.get(path)
+        if sprite is None:
+            sprite = cls._sprites[path] = cls(path)
+        return sprite
+
+    @property
+    def is_animated(self) -> bool:
+        """Are all breathing animation frames built."""
+        return len(self._frames) == self.scale_n_max
+
+    def build_frames(self) -> None:
+        """Cache every possible scale of image for breathing animation."""
+        if self.is_animated:
+            return
+
+        for scale_n in range(2, self.scale_n_max + 1):
+            self._frames[scale_n] = self.__scaled_frame(scale_n)
+
+    def frame(self, scale_n: int) -> pg.Surface:
+        """Get image of the breathing animation scaled scale_n times."""
+        return self._frames[scale_n]
+
+    def mask(self, scale_n: int) -> pg.mask.Mask:
+        """Get collision mask of the frame scaled scale_n times."""
+        mask = self._masks.get(scale_n)
+        if mask is None:
+            mask = self._masks[scale_n] = pg.mask.from_surface(self._frames[scale_n])
+        return mask
+
+    def variant(self, scale_n: int, has_task: bool, is_hovering: bool) -> pg.Surface:
+        """
+        Get frame scaled scale_n times, tinted for task and/or hover state.
+
+        Tinted images are made once and shared - they must not be modified in place.
+        """
+        if not has_task and not is_hovering:
+            return self._frames[scale_n]
+
+        key = (scale_n, has_task, is_hovering)
+        image = self._variants.get(key)
+        if image is None:
+            image = self._frames[scale_n].copy()
+            if has_task:
+                image.fill(self.task_tint, special_flags=pg.BLEND_MULT)
+            if is_hovering:
+                image.fill(self.hover_tint, special_flags=pg.BLEND_MULT)
+            self._variants[key] = image
+        return image
+
+    def __scaled_frame(self, scale_n: int) -> pg.Surface:
+        """Scale base image up scale_n times."""
+        width, height = self.base_image.get_size()
+        new_width = int(width * (1 + scale_n * self.breathing_speed))
+        new_height = int(height * (1 + scale_n * self.breathing_speed))
+        return load_img(self.path, size=(new_width, new_height))
+
+
 class Tile:
     """
     Generic class for Earth tiles.
 
     Class holds information about tile type, its image, and available actions.
+    Images are shared between tiles of same type through TileSprite.
     """
 
-    _image: pg.Surface = None
-
-    pos_x: int = 0
-    pos_y: int = 0
-
     # Variables to handle tile transformation
-    # Storing scale as x multiplier to be able to use dict key
-    scale_n_max: float = 20  # How many times we can scale up
-    scale_n_current: float = 1  # How many times we scaled up
-    breathing_speed: float = 0.025  # how much to scale on each game tick
+    scale_n_current: int = 1  # How many times we scaled up
     breathing_direction: int = 1  # 1 -> outwards, -1 -> inwards
 
-    def __init__(self, image: str):
-        self._image = load_img(image)
+    def __init__(self, image: str, tilemap: Optional[Biome.Tilemap] = None):
+        self.sprite = TileSprite.get(image)
+        # Tilemap this tile belongs to - notified when task of the tile changes
+        self.tilemap = tilemap
 
         # Current task associated with this tile
         # Tiles with tasks have different appearance
-        self.task = None
+        self._task = None
         # If currently hovering over the tile
-        self.is_hovering = False
-
-        scale_percent = TILE_WIDTH / self._image.get_width()
-        new_height = int(self._image.get_height() * scale_percent)
+        self._is_hovering = False
 
-        # scale image based on game screen size
-        self._image = pg.transform.scale(self._image, (TILE_WIDTH, new_height))
-        # Cache every possible scale of image
-        _image_width = self._image.get_width()
-        _image_height = self._image.get_height()
-        self._image_cache = {}
-        scale_n = 1
-        while scale_n <= self.scale_n_max:
-            new_width = int(_image_width * (1 + scale_n * self.breathing_speed))
-            new_height = int(_image_height * (1 + scale_n * self.breathing_speed))
-            self._image_cache[scale_n] = pg.transform.scale(
-                self._image, (new_width, new_height)
-            )
-            scale_n += 1
-
-    def update(self, event: pg.event) -> None:
-        """Update tile size, tint; check if we clicked on task."""
-        # Check if this task was completed
-        if self.task is None:
+    @property
+    def task(self) -> Optional[Task]:
+        """Current task associated with this tile."""
+        return self._task
+
+    @task.setter
+    def task(self, task: Optional[Task]) -> None:
+        """Set task for this tile. Prepares breathing animation for task tiles."""
+        if task is not None:
+            self.sprite.build_frames()
+        else:
             self.scale_n_current = 1
+        if task is not self._task:
+            self._task = task
+            self.__changed()
 
-        # Get tile size to check for collision with mouse
-        image_size = self._image_cache[self.scale_n_current].get_size()
-        tile_rect = pg.Rect(
-            (self.pos_x, self.pos_y), (image_size[0], image_size[1] // 2)
-        )
-        if not game_vars.open_task and tile_rect.collidepoint(pg.mouse.get_pos()):
-            # We clicked on tile - start the task
-            if event.type == pg.MOUSEBUTTONDOWN and self.task is not None:
-                self.task.start()
-            self.is_hovering = True
-        else:
-            self.is_hovering = False
+    @property
+    def is_hovering(self) -> bool:
+        """If currently hovering over the tile."""
+        return self._is_hovering
 
+    @is_hovering.setter
+    def is_hovering(self, is_hovering: bool) -> None:
+        """
+        Set hover state of the tile.
+
+        Tilemap is not notified - hover tint is drawn over the idle tile in biome chunk.
+        """
+        self._is_hovering = is_hovering
+
+    @property
+    def is_live(self) -> bool:
+        """Is tile animated or tinted. Tiles that are not live look like their idle image."""
+        return self._task is not None or self._is_hovering
+
+    def update(self) -> None:
+        """Update tile size. Only live tiles need to be updated."""
         # Animation
         self._breathe()
 
+    def is_hit(self, x: int, y: int) -> bool:
+        """
+        Check if point (relative to the top left corner of tile image) is on the tile.
+
+        Only the top half of the image (top side of the tile) can be hit.
+        """
+        width, height = self.image.get_size()
+        if 0 <= x < width and 0 <= y < height // 2:
+            return bool(self.sprite.mask(self.scale_n_current).get_at((x, y)))
+        return False
+
     @property
     def image(self) -> pg.Surface:
         """
         Returns image of this tile.
 
-        Method transforms the image based on if it is a task or not.
+        Image is tinted based on if it is a task or hovered.
+        Image is shared between tiles - it must not be modified in place.
         """
-        # Get image from cache based on current scale
-        transformed_image = self._image_cache[self.scale_n_current].copy()
-        if self.task is not None:
-            # Add colored tint
-            transformed_image.fill((255, 0, 0), special_flags=pg.BLEND_MULT)
-        if self.is_hovering:
-            transformed_image.fill((0, 0, 255), special_flags=pg.BLEND_MULT)
+        return self.sprite.variant(
+            self.scale_n_current, self.task is not None, self.is_hovering
+        )
+
+    @property
+    def idle_image(self) -> pg.Surface:
+        """Returns image of this tile without task and hover - the one baked into chunks."""
+        return self.sprite.frame(1)
 
-        return transformed_image
+    def __changed(self) -> None:
+        """Let the tilemap know that task of this tile changed."""
+        if self.tilemap is not None:
+            self.tilemap.tile_changed(self)
 
     def _breathe(self) -> None:
         """Will add "breathing" effect to the tile if it has a task active."""
         if self.task is not None:
             # Limit scale
-            if self.scale_n_current >= self.scale_n_max:
+            if self.scale_n_current >= self.sprite.scale_n_max:
                 self.breathing_direction = -1
             elif self.scale_n_current <= 1:
                 self.breathing_direction = 1
@@ -0,0 +1,104 @@
+import logging
+from pathlib import PurePath
+from typing import Dict, Optional, Tuple
+
+from pygame import Surface
+from pygame.image import load
+from pygame.transform import flip, scale
+
+from project.utils.singleton import Singleton
+
+
+logger = logging.getLogger(__name__)
+
+# (path, convert_alpha, size, flip_x)
+CacheKey = Tuple[str, bool, Optional[Tuple[int, int]], bool]
+
+
+class AssetCache(Singleton):
+    """
+    Process-wide cache of decoded, scaled and transformed images.
+
+    Every image is decoded from disk only once. Scaled and flipped variants
+      are derived from the decoded image and cached under their own key,
+      so all game objects share one Surface per (path, alpha, size, transform).
+
+    Surfaces returned by the cache are shared - they must not be modified in place.
+    Use .copy() if an image needs to be drawn on.
+    """
+
+    _surfaces: Dict[CacheKey, Surface] = {}
+
+    hits: int = 0
+    misses: int = 0
+
+    def get(
+        self,
+        path: PurePath,
+        convert_alpha: bool = True,
+        size: Optional[Tuple[int, Optional[int]]] = None,
+        flip_x: bool = False,
+    ) -> Surface:
+        """
+        Get image from cache; load and transform it on cache miss.
+
+        size - (width, height) to scale to. Height can be None to keep aspect ratio.
+        flip_x - flip image horizontally.
+        """
+        if size is not None:
+            size = self.__resolve_size(path, convert_alpha, size)
+
+        key = (str(path), convert_alpha, size, flip_x)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            AssetCache.hits += 1
+            return surface
+
+        AssetCache.misses += 1
+        if flip_x:
+            surface = flip(self.get(path, convert_alpha, size), True, False)
+        elif size is not None:
+            surface = scale(self.get(path, convert_alpha), size)
+        elif convert_alpha:
+            surface = load(str(path)).convert_alpha()
+        else:
+            surface = load(str(path)).convert()
+
+        self._surfaces[key] = surface
+        return surface
+
+    def clear(self) -> None:
+        """Drop all cached images and reset statistics."""
+        self._surfaces.clear()
+        AssetCache.hits = 0
+        AssetCache.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of cache hits to all cache lookups (0 - 1)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+    @property
+    def resident_bytes(self) -> int:
+        """Approximate memory held by cached surfaces pixel data."""
+        return sum(s.get_pitch() * s.get_height() for s in self._surfaces.values())
+
+    def log_stats(self) -> None:
+        """Log cache size, hit rate and memory usage."""
+        logger.debug(
+            f"Asset cache: {len(self._surfaces)} surfaces, "
+            f"{self.hit_rate:.1%} hit rate, "
+            f"{self.resident_bytes / 1024 / 1024:.2f} MB resident"
+        )
+
+    def __resolve_size(
+        self, path: PurePath, convert_alpha: bool, size: Tuple[int, Optional[int]]
+    ) -> Tuple[int, int]:
+        """Calculate missing height, keeping aspect ratio of original image."""
+        width, height = size
+        if height is None:
+            image = self.get(path, convert_alpha)
+            scale_percent = width / image.get_width()
+            height = int(image.get_height() * scale_percent)
+        return (int(width), int(height))
@@ -0,0 +1,44 @@
+from typing import List
+
+import pygame as pg
+
+from project.constants import DIRTY_RECTS, DIRTY_RECTS_MAX_AREA, HEIGHT, WIDTH
+from project.utils.singleton import Singleton
+
+
+class DirtyRects(Singleton):
+    """
+    Keeps track of screen areas that changed since the last display update.
+
+    Objects that draw on the screen report the rectangles they changed.
+    Only those rectangles are sent to the display, unless too much of the screen changed.
+    """
+
+    rects: List[pg.Rect] = []
+    # Whole screen has to be updated
+    full_screen: bool = True
+
+    def add(self, rect: pg.Rect) -> None:
+        """Mark screen area as changed."""
+        if not self.full_screen:
+            self.rects.append(pg.Rect(rect).clip(0, 0, WIDTH, HEIGHT))
+
+    def add_screen(self) -> None:
+        """Mark the whole screen as changed."""
+        self.full_screen = True
+
+    def present(self) -> None:
+        """Send changed screen areas to the display."""
+        area = sum(rect.w * rect.h for rect in self.rects)
+
+        if (
+            not DIRTY_RECTS
+            or self.full_screen
+            or area > WIDTH * HEIGHT * DIRTY_RECTS_MAX_AREA
+        ):
+            pg.display.flip()
+        elif self.rects:
+            pg.display.update(self.rects)
+
+        self.rects = []
+        self.full_screen = False
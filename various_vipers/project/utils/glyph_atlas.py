@@ -0,0 +1,38 @@
+from typing import Dict, Tuple
+
+from pygame import Rect, Surface
+from pygame.font import Font
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered characters of one font and color, for text that changes every frame.
+
+    Text is composed from cached glyph images with a single blits call,
+      so no text has to be rendered by the font.
+    Only characters in GlyphAtlas.characters can be drawn.
+    """
+
+    characters: str = "0123456789.,:-+%s "
+
+    def __init__(self, font: Font, color: Tuple[int, ...], antialias: bool = True):
+        self.glyphs: Dict[str, Surface] = {
+            char: font.render(char, antialias, color) for char in self.characters
+        }
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """Returns (width, height) of the text drawn with this atlas."""
+        return sum(self.glyphs[char].get_width() for char in text), self.height
+
+    def draw(self, screen: Surface, text: str, position: Tuple[int, int]) -> Rect:
+        """Draw text with its top left corner at position. Returns drawn area."""
+        x, y = position
+        draws = []
+        for char in text:
+            glyph = self.glyphs[char]
+            draws.append((glyph, (x, y)))
+            x += glyph.get_width()
+
+        screen.blits(draws, False)
+        return Rect(position[0], y, x - position[0], self.height)
@@ -1,17 +1,31 @@
 from datetime import datetime, timedelta
 from pathlib import PurePath
+from typing import Optional, Tuple
 
 from pygame import Rect, Surface
-from pygame.image import load
 
 from project.constants import SECONDS_TO_DAYS, WIDTH
+from project.utils.asset_cache import AssetCache
+from project.utils.dirty_rects import DirtyRects
 
 
-def load_img(path: PurePath, convert_alpha: bool = True) -> Surface:
-    """Loads an image from path. Optionally enable/disable per-pixel alpha conversion."""
-    if convert_alpha:
-        return load(str(path)).convert_alpha()
-    return load(str(path)).convert()
+asset_cache = AssetCache()
+dirty_rects = DirtyRects()
+
+
+def load_img(
+    path: PurePath,
+    convert_alpha: bool = True,
+    size: Optional[Tuple[int, Optional[int]]] = None,
+    flip_x: bool = False,
+) -> Surface:
+    """
+    Loads an image from path. Optionally enable/disable per-pixel alpha conversion.
+
+    Optionally scale to size (height None keeps aspect ratio) and flip horizontally.
+    Images are cached and shared - returned surface must not be modified in place.
+    """
+    return asset_cache.get(path, convert_alpha, size, flip_x)
 
 
 def fit_to_range(val: float, a: float, b: float, a1: float, b1: float) -> float:
@@ -70,3 +84,4 @@ def draw_infinity_bg(screen: Surface, image: Surface, rect1: Rect, rect2: Rect)
 
     screen.blit(image, rect1)
     screen.blit(image, rect2)
+    dirty_rects.add_screen()
@@ -2,20 +2,35 @@ import time
 from typing import Optional
 
 from pygame import Surface
-from pygame.font import Font
 
 from project.constants import Color, HEIGHT, WIDTH
 from project.utils.helpers import fit_to_range
+from project.utils.text_cache import TextCache
+
+
+text_cache = TextCache()
 
 
 class Notification:
-    """Notification to be displayed on screen."""
+    """
+    Notification to be displayed on screen.
+
+    Text is rendered once, when notification is created, and faded out with alpha.
+    """
 
     def __init__(self, text: str, color: Color, duration: float = 2):
         self.text = text
         self.color = color
         self.duration = duration
 
+        # Own surface (not from text cache) - its alpha is changed while fading
+        self.text_surface = text_cache.font(50).render(self.text, True, self.color)
+        # Top middle of the screen
+        self.position = (
+            int(WIDTH // 2) - int(self.text_surface.get_width() // 2),
+            int(HEIGHT // 6),
+        )
+
         # Start time when notification showed up
         self.start = time.time()
 
@@ -25,13 +40,9 @@ class Notification:
             min(time.time() - self.start, self.duration), 0, self.duration, 400, 0
         )
 
-        font = Font(None, 50)
-        text_surface = font.render(self.text, True, self.color)
-
-        # Top middle of the screen
-        w = int(WIDTH // 2) - int(text_surface.get_width() // 2)
-        h = int(HEIGHT // 6)
-        screen.blit(text_surface, (w, h))
+        # Fully visible for the first part of duration, then fades out
+        self.text_surface.set_alpha(min(int(alpha), 255))
+        screen.blit(self.text_surface, self.position)
 
         # We use alpha to check if notification should be still drawn
         return self if alpha > 0 else None
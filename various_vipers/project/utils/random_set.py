@@ -0,0 +1,54 @@
+import random
+from typing import Dict, Generic, Iterable, Iterator, List, TypeVar
+
+
+T = TypeVar("T")
+
+
+class RandomSet(Generic[T]):
+    """
+    Set that can return a random item in constant time.
+
+    Items are kept in a list, with a dict of list indexes.
+    Removed item is swapped with the last item, so removing is constant time too.
+    """
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: List[T] = []
+        self._indexes: Dict[T, int] = {}
+
+        for item in items:
+            self.add(item)
+
+    def add(self, item: T) -> None:
+        """Add item to the set."""
+        if item not in self._indexes:
+            self._indexes[item] = len(self._items)
+            self._items.append(item)
+
+    def discard(self, item: T) -> None:
+        """Remove item from the set if it is present."""
+        index = self._indexes.pop(item, None)
+        if index is None:
+            return
+
+        last = self._items.pop()
+        if index < len(self._items):
+            self._items[index] = last
+            self._indexes[last] = index
+
+    def choice(self) -> T:
+        """Returns a random item. Raises IndexError if the set is empty."""
+        return random.choice(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        """Check if item is in the set."""
+        return item in self._indexes
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate through items in the set."""
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        """Get count of items in the set."""
+        return len(self._items)
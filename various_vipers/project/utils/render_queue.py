@@ -0,0 +1,48 @@
+from typing import Iterator, List, Tuple
+
+from pygame import Surface
+
+
+# (screen x, screen y, image)
+Draw = Tuple[int, int, Surface]
+
+
+class RenderQueue:
+    """
+    Collects draws of isometric tiles and emits them in painter's order.
+
+    Draws are bucketed by row, so any number of biomes and rows of any length
+      can be queued in any order. Rows further back are drawn first,
+      and draws within a row are drawn from left to right.
+    Rows are emitted one by one, so other images can be drawn between them.
+    """
+
+    def __init__(self):
+        self._rows: List[List[Draw]] = []
+
+    def add(self, row: int, x: int, y: int, image: Surface) -> None:
+        """Queue image to be drawn at (x, y) as part of the given tile row."""
+        while len(self._rows) <= row:
+            self._rows.append([])
+        self._rows[row].append((x, y, image))
+
+    def clear(self) -> None:
+        """Remove all queued draws."""
+        self._rows.clear()
+
+    def row_draws(
+        self, row: int, offset_y: int = 0
+    ) -> Iterator[Tuple[Surface, Tuple[int, int]]]:
+        """Yields (image, position) of a single row, from left to right."""
+        if row >= len(self._rows):
+            return
+
+        draws = self._rows[row]
+        # Rows are usually queued from left to right already - sort is linear then
+        draws.sort(key=lambda draw: draw[0])
+        for x, y, image in draws:
+            yield image, (x, y + offset_y)
+
+    def __len__(self) -> int:
+        """Get count of queued draws."""
+        return sum(len(row) for row in self._rows)
@@ -0,0 +1,108 @@
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from pygame import Surface
+from pygame.font import Font
+
+from project.constants import TEXT_CACHE_SIZE
+from project.utils.glyph_atlas import GlyphAtlas
+from project.utils.singleton import Singleton
+
+
+logger = logging.getLogger(__name__)
+
+# (font name, size, bold)
+FontKey = Tuple[Optional[str], int, bool]
+# (font key, text, color, antialias)
+TextKey = Tuple[FontKey, str, Tuple[int, ...], bool]
+
+
+class TextCache(Singleton):
+    """
+    Process-wide registry of fonts and cache of rendered text.
+
+    Every font (name, size, bold) is created only once.
+    Rendered text surfaces are kept in a least recently used cache,
+      bounded by TEXT_CACHE_SIZE - text that does not change is rendered only once.
+    Text that changes every frame (numbers) should be drawn with glyph atlases.
+
+    Surfaces returned by the cache are shared - they must not be modified in place.
+    """
+
+    _fonts: Dict[FontKey, Font] = {}
+    _texts: "OrderedDict[TextKey, Surface]" = OrderedDict()
+    _atlases: Dict[Tuple[FontKey, Tuple[int, ...], bool], GlyphAtlas] = {}
+
+    hits: int = 0
+    misses: int = 0
+
+    def font(self, size: int, name: Optional[str] = None, bold: bool = False) -> Font:
+        """Get font of given size; create it if it does not exist yet."""
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = Font(name, size)
+            font.set_bold(bold)
+        return font
+
+    def render(
+        self,
+        text: str,
+        size: int,
+        color: Tuple[int, ...],
+        antialias: bool = True,
+        name: Optional[str] = None,
+        bold: bool = False,
+    ) -> Surface:
+        """Get rendered text from cache; render it on cache miss."""
+        key = ((name, size, bold), text, tuple(color), antialias)
+        surface = self._texts.get(key)
+        if surface is not None:
+            TextCache.hits += 1
+            self._texts.move_to_end(key)
+            return surface
+
+        TextCache.misses += 1
+        surface = self.font(size, name, bold).render(text, antialias, color)
+
+        self._texts[key] = surface
+        if len(self._texts) > TEXT_CACHE_SIZE:
+            # Drop least recently used text
+            self._texts.popitem(last=False)
+        return surface
+
+    def atlas(
+        self,
+        size: int,
+        color: Tuple[int, ...],
+        antialias: bool = True,
+        name: Optional[str] = None,
+        bold: bool = False,
+    ) -> GlyphAtlas:
+        """Get glyph atlas of the font and color; create it if it does not exist yet."""
+        key = ((name, size, bold), tuple(color), antialias)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(self.font(size, name, bold), color, antialias)
+            self._atlases[key] = atlas
+        return atlas
+
+    def clear(self) -> None:
+        """Drop all rendered text and reset statistics. Fonts are kept."""
+        self._texts.clear()
+        TextCache.hits = 0
+        TextCache.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of cache hits to all cache lookups (0 - 1)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+    def log_stats(self) -> None:
+        """Log fonts count, cached text count and hit rate."""
+        logger.debug(
+            f"Text cache: {len(self._fonts)} fonts, {len(self._texts)} texts, "
+            f"{self.hit_rate:.1%} hit rate"
+        )